@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai local - Tony
+=========================
+
+Ce script mesure les performances du scraper intégré sans toucher au vrai site :
+1. Démarre un faux site Le Spot en local (connexion en deux étapes, catalogue avec
+   'Voir plus' en XHR, pages de profil avec les sections #object-..., liens forward/)
+2. Lance TonyCompletIntegratedScraper dessus, sans interface
+3. Affiche profils/seconde, latence par profil (p50/p95) et mémoire maximale, dont celle de
+   l'arbre chromedriver/Chrome échantillonnée pendant le run
+
+Utilisation :
+    python banc_essai_tony.py [options]
+
+Exemples :
+    python banc_essai_tony.py --profils 200                      # 200 profils, réglages par défaut
+    python banc_essai_tony.py --profils 500 --concurrence 4 --http
+    python banc_essai_tony.py --serveur-seul --port 8765          # site de test uniquement
+"""
+
+import argparse
+import html
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import logging
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+CHEMIN_CATALOGUE = "/fr/sheet/926247/catalog"
+COOKIE_SESSION = "banc_session"
+
+# Identifiants des sections du vrai site : le banc garde les mêmes pour exercer les deux stratégies
+SECTIONS_PROFIL = [
+    ("object-d6fa1ac7", "Éléments clés", lambda i: [
+        f"Effectifs : {10 * (i % 50 + 1)}",
+        f"Chiffre d'affaires : {i % 90 + 1} M€",
+        "Transformation digitale du retail",
+    ], False),
+    ("object-Me3f9M9edd", "Secteur d'activité", lambda i: ["Commerce", f"Secteur {i % 12}"], True),
+    ("object-M4561Macb7", "Ma mission en une phrase", lambda i: [f"Mission du profil {i}"], False),
+    ("object-M91ceM1169", "Nombre de points de vente", lambda i: [str(i % 300)], True),
+    ("object-M184bM50c8", "Solutions recherchées", lambda i: ["Data", f"Solution {i % 7}"], True),
+]
+
+# GIF transparent de 1 pixel pour les avatars
+AVATAR_GIF = bytes.fromhex("47494638396101000100800000ffffff00000021f90401000000002c00000000010001000002024401003b")
+
+
+def page(titre, corps):
+    return f"""<!DOCTYPE html>
+<html lang="fr"><head><meta charset="utf-8"><title>{html.escape(titre)}</title></head>
+<body>{corps}</body></html>"""
+
+
+def carte_html(i):
+    return f"""<div class="catalog__item">
+  <a class="catalog-link" href="/fr/profile/{i}">
+    <div class="catalog-avatar"><img src="/avatar/{i}.gif" alt=""></div>
+    <div class="catalog-company">Entreprise {i}</div>
+    <div class="catalog-name">Prénom Nom {i}</div>
+    <div class="catalog-position">Poste {i}</div>
+  </a>
+</div>"""
+
+
+def profil_html(i):
+    sections = []
+    for identifiant, titre, lignes, surlignee in SECTIONS_PROFIL:
+        items = "".join(
+            f'<li class="highlight">{html.escape(ligne)}</li>' if surlignee and position == len(lignes(i)) - 1
+            else f"<li>{html.escape(ligne)}</li>"
+            for position, ligne in enumerate(lignes(i))
+        )
+        sections.append(f"""<section id="{identifiant}">
+  <h2>{html.escape(titre)}</h2>
+  <div class="section__content"><ul>{items}</ul></div>
+</section>""")
+    lien = f'<a href="/forward/{i}" target="_blank">LinkedIn</a>'
+    return page(f"Profil {i}", f"<main><h1>Prénom Nom {i}</h1>{''.join(sections)}{lien}</main>")
+
+
+class SiteTest(ThreadingHTTPServer):
+    """Faux site Le Spot : `nb_profils` profils, `taille_page` cartes par page de catalogue"""
+
+    daemon_threads = True
+
+    def __init__(self, adresse, nb_profils=100, taille_page=20, latence=0.0):
+        super().__init__(adresse, GestionnaireSiteTest)
+        self.nb_profils = nb_profils
+        self.taille_page = taille_page
+        self.latence = latence
+        self.requetes = 0
+        self._verrou = threading.Lock()
+
+    @property
+    def url(self):
+        hote, port = self.server_address[:2]
+        return f"http://{hote}:{port}"
+
+    def page_catalogue(self, numero):
+        debut = numero * self.taille_page
+        fin = min(debut + self.taille_page, self.nb_profils)
+        return "\n".join(carte_html(i) for i in range(debut + 1, fin + 1)), fin < self.nb_profils
+
+
+class GestionnaireSiteTest(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def repondre(self, statut, corps=b"", type_contenu="text/html; charset=utf-8", en_tetes=None):
+        if isinstance(corps, str):
+            corps = corps.encode('utf-8')
+        self.send_response(statut)
+        self.send_header("Content-Type", type_contenu)
+        self.send_header("Content-Length", str(len(corps)))
+        for nom, valeur in (en_tetes or {}).items():
+            self.send_header(nom, valeur)
+        self.end_headers()
+        self.wfile.write(corps)
+
+    def rediriger(self, cible, en_tetes=None):
+        self.repondre(302, en_tetes={"Location": cible, **(en_tetes or {})})
+
+    def connecte(self):
+        return f"{COOKIE_SESSION}=ok" in self.headers.get("Cookie", "")
+
+    def avant_reponse(self):
+        with self.server._verrou:
+            self.server.requetes += 1
+        if self.server.latence:
+            time.sleep(self.server.latence)
+
+    def do_POST(self):
+        self.avant_reponse()
+        chemin = urllib.parse.urlsplit(self.path).path
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if chemin == "/fr/login":
+            # Étape 2 de la connexion : le mot de passe
+            self.repondre(200, page("Connexion", """
+<form id="registration-form" method="post" action="/fr/login/password">
+  <input id="login_password" name="password" type="password">
+</form>
+<button type="submit" form="registration-form">Se connecter</button>"""))
+        elif chemin == "/fr/login/password":
+            self.rediriger("/fr/home", {"Set-Cookie": f"{COOKIE_SESSION}=ok; Path=/"})
+        else:
+            self.repondre(404, "introuvable")
+
+    def do_GET(self):
+        self.avant_reponse()
+        morceaux = urllib.parse.urlsplit(self.path)
+        chemin = morceaux.path
+        parametres = urllib.parse.parse_qs(morceaux.query)
+
+        if chemin in ("/", "/fr/login"):
+            # Étape 1 de la connexion : l'email
+            self.repondre(200, page("Connexion", """
+<form id="registration-form-login" method="post" action="/fr/login">
+  <input id="email_email" name="email" type="email">
+</form>
+<button type="submit" form="registration-form-login">Valider</button>"""))
+        elif chemin.startswith("/avatar/"):
+            self.repondre(200, AVATAR_GIF, "image/gif")
+        elif chemin.startswith("/forward/"):
+            numero = chemin.rsplit("/", 1)[-1]
+            self.rediriger(f"https://www.linkedin.com/in/profil-{numero}")
+        elif not self.connecte():
+            self.rediriger("/fr/login")
+        elif chemin == "/fr/home":
+            self.repondre(200, page("Accueil", f"""
+<nav><a href="{CHEMIN_CATALOGUE}"><span class="nav-item-icon icon-Catalogue">Catalogue</span></a></nav>"""))
+        elif chemin == CHEMIN_CATALOGUE:
+            cartes, suite = self.server.page_catalogue(0)
+            bouton = '<button class="btn btn-primary see-more" type="button">Voir plus</button>' if suite else ""
+            self.repondre(200, page("Catalogue", f"""
+<label><input type="radio" name="orderBy" id="orderBy_2" checked> Derniers inscrits</label>
+<div class="catalog">{cartes}</div>
+{bouton}
+<script>
+let pageCourante = 0;
+const bouton = document.querySelector('.see-more');
+if (bouton) bouton.addEventListener('click', function () {{
+    const requete = new XMLHttpRequest();
+    requete.open('GET', '{CHEMIN_CATALOGUE}/more?page=' + (pageCourante + 1));
+    requete.onload = function () {{
+        pageCourante += 1;
+        document.querySelector('.catalog').insertAdjacentHTML('beforeend', requete.responseText);
+        if (requete.getResponseHeader('X-Derniere-Page') === '1') bouton.remove();
+    }};
+    requete.send();
+}});
+</script>"""))
+        elif chemin == f"{CHEMIN_CATALOGUE}/more":
+            numero = int(parametres.get("page", ["1"])[0])
+            cartes, suite = self.server.page_catalogue(numero)
+            self.repondre(200, cartes, en_tetes={"X-Derniere-Page": "0" if suite else "1"})
+        elif chemin.startswith("/fr/profile/"):
+            numero = chemin.rsplit("/", 1)[-1]
+            if not numero.isdigit() or not 1 <= int(numero) <= self.server.nb_profils:
+                self.repondre(404, "introuvable")
+            else:
+                self.repondre(200, profil_html(int(numero)))
+        else:
+            self.repondre(404, "introuvable")
+
+
+def centile(valeurs, proportion):
+    """Centile par rang le plus proche sur une liste triée"""
+    if not valeurs:
+        return 0.0
+    return valeurs[min(len(valeurs) - 1, max(0, round(proportion * len(valeurs)) - 1))]
+
+
+def rss_descendants_ko():
+    """RSS cumulée (Ko) de tous les processus descendants du processus courant, lue dans /proc
+
+    Couvre chromedriver et tout l'arbre Chrome pendant qu'ils tournent ; les pages partagées
+    entre processus Chrome sont comptées plusieurs fois (majorant). None hors Linux.
+    """
+    if not os.path.isdir('/proc'):
+        return None
+    enfants = {}
+    for entree in os.listdir('/proc'):
+        if not entree.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entree}/stat', encoding='utf-8') as f:
+                # Le nom du processus (entre parenthèses) peut contenir des espaces
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        enfants.setdefault(ppid, []).append(int(entree))
+
+    total, a_voir = 0, list(enfants.get(os.getpid(), []))
+    while a_voir:
+        pid = a_voir.pop()
+        a_voir.extend(enfants.get(pid, []))
+        try:
+            with open(f'/proc/{pid}/status', encoding='utf-8') as f:
+                for ligne in f:
+                    if ligne.startswith('VmRSS:'):
+                        total += int(ligne.split()[1])
+                        break
+        except (OSError, ValueError):
+            continue
+    return total
+
+
+class EchantillonneurRSS(threading.Thread):
+    """Relève périodiquement la RSS des processus descendants et en garde le pic"""
+
+    def __init__(self, intervalle=0.5):
+        super().__init__(name="echantillonneur_rss", daemon=True)
+        self.intervalle = intervalle
+        self.pic_ko = None
+        self._arret = threading.Event()
+
+    def run(self):
+        while True:
+            rss = rss_descendants_ko()
+            if rss is not None:
+                self.pic_ko = max(self.pic_ko or 0, rss)
+            if self._arret.wait(self.intervalle):
+                return
+
+    def arreter(self):
+        self._arret.set()
+        self.join()
+
+
+def lancer_banc(args, site):
+    """Exécute le scraper sur le site de test et retourne le rapport de performances"""
+    # L'URL du site doit être fixée avant l'import du scraper
+    os.environ["TONY_URL_SITE"] = site.url
+    from scraping_tony_complet_integrated import TonyCompletIntegratedScraper
+
+    latences = []
+
+    class ScraperChronometre(TonyCompletIntegratedScraper):
+        def enrichir_profil(self, profil_base, driver=None):
+            debut = time.monotonic()
+            try:
+                return super().enrichir_profil(profil_base, driver)
+            finally:
+                latences.append(time.monotonic() - debut)
+
+    with tempfile.TemporaryDirectory(prefix="banc_tony_") as dossier:
+        scraper = ScraperChronometre(
+            concurrence=args.concurrence,
+            mode_http=args.http,
+            pagination_directe=args.pagination_directe,
+            pipeline=args.pipeline,
+            mode_leger=args.leger,
+            sans_interface=True,
+            nombre_profils=args.nombre,
+            fichier_cache_redirections=None,
+            fichier_selecteurs=None,
+            fichier_profils_connus=os.path.join(dossier, "profils_connus.json"),
+            dossier_sortie=dossier,
+            formats=(),
+            debit_site=args.debit,
+            max_requetes_simultanees=max(8, 2 * args.concurrence),
+        )
+        echantillonneur = EchantillonneurRSS()
+        echantillonneur.start()
+        debut = time.monotonic()
+        try:
+            succes = scraper.run()
+        finally:
+            duree = time.monotonic() - debut
+            echantillonneur.arreter()
+
+    latences.sort()
+    return {
+        'succes': bool(succes),
+        'profils_catalogue': args.profils,
+        'profils_scrapes': scraper.nb_profils_complets,
+        'duree_s': round(duree, 2),
+        'profils_par_seconde': round(scraper.nb_profils_complets / duree, 2) if duree else 0.0,
+        'latence_p50_s': round(centile(latences, 0.50), 3),
+        'latence_p95_s': round(centile(latences, 0.95), 3),
+        'requetes_serveur': site.requetes,
+        # ru_maxrss est en Ko sous Linux ; chromedriver et Chrome sont échantillonnés pendant le run
+        'rss_max_python_mo': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'rss_max_navigateurs_mo': (
+            round(echantillonneur.pic_ko / 1024, 1) if echantillonneur.pic_ko is not None else None
+        ),
+        'options': {
+            'concurrence': args.concurrence, 'http': args.http, 'pagination_directe': args.pagination_directe,
+            'pipeline': args.pipeline, 'leger': args.leger, 'latence_serveur_s': args.latence,
+        },
+    }
+
+
+def afficher_rapport(rapport):
+    print("\n" + "=" * 50)
+    print("📊 BANC D'ESSAI")
+    print("=" * 50)
+    print(f"Profils scrapés      : {rapport['profils_scrapes']}/{rapport['profils_catalogue']}")
+    print(f"Durée totale         : {rapport['duree_s']:.2f}s")
+    print(f"Débit                : {rapport['profils_par_seconde']:.2f} profils/s")
+    print(f"Latence par profil   : p50 {rapport['latence_p50_s']:.3f}s, p95 {rapport['latence_p95_s']:.3f}s")
+    print(f"Requêtes serveur     : {rapport['requetes_serveur']}")
+    print(f"RSS max (Python)     : {rapport['rss_max_python_mo']:.1f} Mo")
+    if rapport['rss_max_navigateurs_mo'] is not None:
+        print(f"RSS max (navigateurs): {rapport['rss_max_navigateurs_mo']:.1f} Mo (somme de l'arbre chromedriver/Chrome)")
+    else:
+        print("RSS max (navigateurs): indisponible (pas de /proc)")
+    print("=" * 50)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai local du scraper intégré")
+    parser.add_argument('--profils', type=int, default=100, help="nombre de profils du faux catalogue")
+    parser.add_argument('--taille-page', type=int, default=20, help="cartes par page de 'Voir plus'")
+    parser.add_argument('--latence', type=float, default=0.0, help="latence ajoutée à chaque réponse (secondes)")
+    parser.add_argument('--port', type=int, default=0, help="port du site de test (0 = libre)")
+    parser.add_argument('--serveur-seul', action='store_true', help="servir le site de test sans lancer le scraper")
+    parser.add_argument('--nombre', type=int, default=0, help="profils à scraper (0 = tous)")
+    parser.add_argument('--concurrence', type=int, default=1)
+    parser.add_argument('--http', action='store_true')
+    parser.add_argument('--pagination-directe', action='store_true')
+    parser.add_argument('--pipeline', action='store_true')
+    parser.add_argument('--leger', action='store_true')
+    parser.add_argument('--debit', type=float, default=1000.0,
+                        help="budget de requêtes/s du scraper vers le site de test (élevé par défaut)")
+    parser.add_argument('--json', help="fichier où ajouter le rapport en JSON (une ligne par exécution)")
+    args = parser.parse_args()
+
+    site = SiteTest(("127.0.0.1", args.port), args.profils, args.taille_page, args.latence)
+    logger.info(f"🧪 Site de test : {site.url} ({args.profils} profils)")
+
+    if args.serveur_seul:
+        try:
+            site.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            site.server_close()
+        return
+
+    threading.Thread(target=site.serve_forever, daemon=True).start()
+    try:
+        rapport = lancer_banc(args, site)
+    finally:
+        site.shutdown()
+        site.server_close()
+
+    afficher_rapport(rapport)
+    if args.json:
+        with open(args.json, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(rapport, ensure_ascii=False) + "\n")
+    sys.exit(0 if rapport['succes'] else 1)
+
+
+if __name__ == "__main__":
+    main()
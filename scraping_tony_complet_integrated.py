@@ -13,28 +13,57 @@ Le script maintient la connexion tout au long du processus et navigue
 intelligemment entre la liste et les pages détaillées.
 
 Utilisation :
-    python scraping_tony_complet_integrated.py [nombre_profils]
+    python scraping_tony_complet_integrated.py [nombre_profils] [options]
     
 Arguments :
-    nombre_profils : Nombre de profils à traiter (0 pour tous, défaut: 2)
+    nombre_profils : Nombre de profils à traiter (0 pour tous) ; sans lui, ni --nombre ni
+                     --config, il est demandé interactivement
 
 Exemples :
     python scraping_tony_complet_integrated.py 3    # 3 profils complets
-    python scraping_tony_complet_integrated.py 0    # Tous les profils
-    python scraping_tony_complet_integrated.py       # 2 profils (défaut)
+    python scraping_tony_complet_integrated.py 0 --sans-interface --formats json,csv
+    python scraping_tony_complet_integrated.py --config lot_nuit.json   # exécution planifiée (cron)
+    python scraping_tony_complet_integrated.py --re-extraire --archive archive_tony --schema schema.json
+
+Le fichier --config est un objet JSON dont les clés sont les noms des options
+(ex. {"nombre": 0, "sans_interface": true, "concurrence": 4, "dossier_sortie": "sorties",
+"formats": ["json", "csv"]}) ;
+les options passées en ligne de commande sont prioritaires.
 """
 
+import argparse
 import json
 import csv
+import functools
+import gzip
+import hashlib
 import time
 import sys
 import os
+import posixpath
+import queue
+import random
+import re
+import shlex
+import subprocess
+import threading
+import unicodedata
+import urllib.parse
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, WebDriverException
+)
 from selenium.webdriver.common.action_chains import ActionChains
 import logging
 
@@ -42,16 +71,1574 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Surchargeable par TONY_URL_SITE, pour viser le site de test local (banc_essai_tony.py)
+URL_SITE = os.environ.get("TONY_URL_SITE", "https://le-spot.retail-leaders.fr").rstrip('/')
+
+# Sélecteurs de secours du catalogue, du plus spécifique au plus générique
+SELECTEURS_PROFILS = [
+    ".catalog__item",
+    ".catalog-item",
+    "[class*='catalog'] [class*='item']",
+    ".card-profile",
+    ".catalog-card",
+    "[class*='profile-card']"
+]
+
+SELECTEURS_ENTREPRISE = [
+    ".catalog-company",
+    ".catalog__title", 
+    ".company-name",
+    "[class*='title']",
+    "[class*='company']"
+]
+
+SELECTEURS_NOM = [
+    ".catalog-name",
+    ".user__infos .name",
+    ".user__name",
+    ".profile-name",
+    "[class*='name']"
+]
+
+SELECTEURS_POSTE = [
+    ".catalog-position",
+    ".user__infos .job",
+    ".user__job",
+    ".profile-job",
+    "[class*='job']",
+    "[class*='position']"
+]
+
+SELECTEURS_URL = [
+    "a.catalog-link",
+    ".catalog-sheet-more",
+    "[href*='profile']",
+    "[href*='user']",
+    "a[href*='sheet']"
+]
+
+SELECTEURS_AVATAR = [
+    ".catalog-avatar img",
+    ".user-avatar img",
+    "[class*='avatar'] img",
+    "img[src*='avatar']"
+]
+
+# Sections de la page détaillée d'un profil, repérées par le texte de leur titre
+# (mots-clés sans accents ni majuscules, cf. normaliser_titre)
+TITRES_SECTIONS = {
+    'elements_cles': "elements cles",
+    'secteur_activite': "secteur",
+    'mission': "mission",
+    'nombre_points_vente': "points de vente",
+    'solutions_competences': "solutions",
+}
+
+# Sélecteurs de secours si le titre d'une section n'est pas reconnu
+SELECTEURS_ELEMENTS_CLES = ["#object-d6fa1ac7 .section__content li"]
+
+SELECTEURS_SECTEUR = [
+    "#object-Me3f9M9edd .section__content li.highlight",
+    "*[id*='secteur'] .section__content li"
+]
+
+SELECTEURS_MISSION = [
+    "#object-M4561Macb7 .section__content li",
+    "*[id*='mission'] .section__content li"
+]
+
+SELECTEURS_POINTS_VENTE = [
+    "#object-M91ceM1169 .section__content li.highlight",
+    "*[id*='vente'] .section__content li"
+]
+
+SELECTEURS_SOLUTIONS = [
+    "#object-M184bM50c8 .section__content li.highlight",
+    "*[id*='solution'] .section__content li"
+]
+
+# Motifs bloqués en mode léger (CDP Network.setBlockedURLs) : on ne lit que du texte et des liens.
+# Les domaines listés sont une liste fixe de traqueurs et lecteurs connus, pas un filtre
+# général des domaines tiers. Le blocage CDP ne vaut que pour un onglet : voir ouvrir_onglet().
+URLS_BLOQUEES_MODE_LEGER = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*connect.facebook.com*", "*hotjar.com*", "*licdn.com*",
+    "*clarity.ms*", "*hubspot.com*", "*axeptio*", "*youtube.com*", "*vimeo.com*",
+]
+
+# Taille maximale du pool de connexions de la session HTTP
+TAILLE_POOL_HTTP = 16
+
+SELECTEUR_LIEN_FORWARD = "a[href*='forward/'][target='_blank']"
+SELECTEUR_LIEN_LINKEDIN = "a[href*='linkedin.com/in/']"
+
+# Mots-clés qui signalent la ligne de compétences parmi les Éléments clés
+MOTS_CLES_COMPETENCES = ['transformation', 'digital', 'retail', 'tech']
+
+# Schéma d'extraction par défaut, surchargeable par un fichier JSON (cf. SchemaExtraction)
+SCHEMA_EXTRACTION_DEFAUT = {
+    'catalogue': {
+        'conteneur': SELECTEURS_PROFILS,
+        'champs': {
+            'entreprise': {'selecteurs': SELECTEURS_ENTREPRISE, 'defaut': "Non trouvé (entreprise)"},
+            'nom_prenom': {'selecteurs': SELECTEURS_NOM, 'defaut': "Non trouvé (nom)"},
+            'poste': {'selecteurs': SELECTEURS_POSTE, 'defaut': "Non trouvé (poste)"},
+            'url_profil': {'selecteurs': SELECTEURS_URL, 'attribut': 'href', 'type': 'url', 'defaut': "Non disponible"},
+            'avatar_url': {'selecteurs': SELECTEURS_AVATAR, 'attribut': 'src', 'type': 'url', 'defaut': ""},
+        },
+    },
+    'detail': {
+        'champs': {
+            'elements_cles.effectifs': {
+                'section': TITRES_SECTIONS['elements_cles'], 'selecteurs': SELECTEURS_ELEMENTS_CLES,
+                'commence_par': "Effectifs", 'retirer_prefixe': "Effectifs : ", 'facultatif': True,
+            },
+            'elements_cles.chiffre_affaires': {
+                'section': TITRES_SECTIONS['elements_cles'], 'selecteurs': SELECTEURS_ELEMENTS_CLES,
+                'commence_par': "Chiffre d'affaires", 'retirer_prefixe': "Chiffre d'affaires : ", 'facultatif': True,
+            },
+            'elements_cles.competences': {
+                'section': TITRES_SECTIONS['elements_cles'], 'selecteurs': SELECTEURS_ELEMENTS_CLES,
+                'contient': MOTS_CLES_COMPETENCES, 'facultatif': True,
+            },
+            'secteur_activite': {
+                'section': TITRES_SECTIONS['secteur_activite'], 'dans_section': ["li.highlight", "li"],
+                'selecteurs': SELECTEURS_SECTEUR,
+            },
+            'mission': {'section': TITRES_SECTIONS['mission'], 'selecteurs': SELECTEURS_MISSION},
+            'nombre_points_vente': {
+                'section': TITRES_SECTIONS['nombre_points_vente'], 'dans_section': ["li.highlight", "li"],
+                'selecteurs': SELECTEURS_POINTS_VENTE,
+            },
+            'solutions_competences': {
+                'section': TITRES_SECTIONS['solutions_competences'], 'dans_section': ["li.highlight", "li"],
+                'selecteurs': SELECTEURS_SOLUTIONS,
+            },
+            'lien_forward': {'selecteurs': [SELECTEUR_LIEN_FORWARD], 'attribut': 'href', 'type': 'url'},
+            'lien_linkedin_direct': {'selecteurs': [SELECTEUR_LIEN_LINKEDIN], 'attribut': 'href', 'type': 'url'},
+        },
+    },
+}
+
+# Script injecté : applique un plan compilé par SchemaExtraction à toute la page en un seul appel.
+# Retourne les valeurs brutes (texte, attribut ou liste) ; le post-traitement est fait en Python.
+SCRIPT_SCHEMA = """
+const [plan, racine, debut] = arguments;
+
+function normaliser(texte) {
+    return texte.normalize('NFD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase().split(/\\s+/).join(' ').trim();
+}
+
+let sections = null;
+function section(motCle) {
+    if (sections === null) {
+        sections = [];
+        for (const contenu of document.querySelectorAll('.section__content')) {
+            let titre = contenu.previousElementSibling;
+            if (!titre || !/^H[1-4]$/.test(titre.tagName)) {
+                titre = contenu.parentElement ? contenu.parentElement.querySelector('h1, h2, h3, h4') : null;
+            }
+            if (titre) sections.push([normaliser(titre.innerText || titre.textContent || ''), contenu]);
+        }
+    }
+    const trouvee = sections.find(([titre]) => titre.includes(motCle));
+    return trouvee ? trouvee[1] : null;
+}
+
+function valeur(element, attribut) {
+    if (attribut) return element[attribut] || element.getAttribute(attribut) || '';
+    return (element.innerText || element.textContent || '').trim();
+}
+
+function extraire(conteneur, selecteur, champ) {
+    try {
+        if (champ.tous) {
+            const valeurs = Array.from(conteneur.querySelectorAll(selecteur))
+                .map(element => valeur(element, champ.attribut)).filter(v => v);
+            return valeurs.length ? valeurs : null;
+        }
+        const element = conteneur.querySelector(selecteur);
+        return element ? (valeur(element, champ.attribut) || null) : null;
+    } catch (e) {
+        return null;
+    }
+}
+
+function extraireRacine(element) {
+    const resultat = {_gagnants: {}};
+    for (const champ of plan.champs) {
+        let trouve = null;
+        if (champ.section) {
+            const contenu = section(champ.section);
+            for (const selecteur of (contenu ? champ.dans_section : [])) {
+                trouve = extraire(contenu, selecteur, champ);
+                if (trouve) break;
+            }
+        }
+        if (!trouve && champ.selecteurs.length) {
+            resultat._gagnants[champ.nom] = null;
+            for (const selecteur of champ.selecteurs) {
+                trouve = extraire(element, selecteur, champ);
+                if (trouve) { resultat._gagnants[champ.nom] = selecteur; break; }
+            }
+        }
+        resultat[champ.nom] = trouve;
+    }
+    return resultat;
+}
+
+let racines = racine ? [racine] : [document];
+if (!racine && plan.conteneur) {
+    racines = [];
+    for (const selecteur of plan.conteneur) {
+        try { racines = Array.from(document.querySelectorAll(selecteur)); } catch (e) { racines = []; }
+        if (racines.length > 0) break;
+    }
+    racines = racines.slice(debut || 0);
+}
+return racines.map(extraireRacine);
+"""
+
+
+def normaliser_titre(texte):
+    """Titre de section en minuscules, sans accents ni espaces superflus"""
+    sans_accents = unicodedata.normalize('NFKD', texte)
+    sans_accents = "".join(c for c in sans_accents if not unicodedata.combining(c))
+    return " ".join(sans_accents.lower().split())
+
+
+def localiser_sections_html(soup):
+    """Titre normalisé de chaque section -> son noeud `.section__content`, comme SCRIPT_SCHEMA"""
+    sections = {}
+    for contenu in soup.select('.section__content'):
+        titre = contenu.find_previous_sibling()
+        if not titre or titre.name not in ('h1', 'h2', 'h3', 'h4'):
+            titre = contenu.parent.find(['h1', 'h2', 'h3', 'h4']) if contenu.parent else None
+        if titre:
+            sections.setdefault(normaliser_titre(texte_noeud(titre)), contenu)
+    return sections
+
+
+def texte_noeud(noeud):
+    """Texte d'un noeud BeautifulSoup avec espaces normalisés, comme `.text` côté Selenium"""
+    return " ".join(noeud.get_text(" ").split())
+
+
+def ecrire_fichier_atomique(chemin, contenu, permissions=0o666):
+    """Écrit `contenu` (texte ou octets) dans un fichier temporaire puis le renomme sur `chemin`
+
+    Un lecteur (autre worker, node_exporter) ne voit jamais un fichier à moitié écrit ;
+    le suffixe processus + thread évite que deux écrivains partagent le même temporaire.
+    """
+    temporaire = f"{chemin}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        descripteur = os.open(temporaire, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, permissions)
+        if isinstance(contenu, bytes):
+            with os.fdopen(descripteur, 'wb') as f:
+                f.write(contenu)
+        else:
+            with os.fdopen(descripteur, 'w', encoding='utf-8') as f:
+                f.write(contenu)
+        os.replace(temporaire, chemin)
+    except BaseException:
+        if os.path.exists(temporaire):
+            os.remove(temporaire)
+        raise
+
+
+def ecrire_json_atomique(chemin, donnees, indent=2, permissions=0o666):
+    """Sérialise `donnees` en JSON (UTF-8 lisible) et l'écrit atomiquement sur `chemin`"""
+    ecrire_fichier_atomique(chemin, json.dumps(donnees, ensure_ascii=False, indent=indent), permissions)
+
+
+class ResolveurSelecteurs:
+    """Statistiques des sélecteurs de secours, champ par champ
+
+    L'ordre de priorité déclaré (du plus précis au plus générique) est toujours respecté :
+    un sélecteur générique qui a gagné sur une carte incomplète ne doit pas passer devant
+    les sélecteurs précis pour les cartes suivantes. Seuls les sélecteurs morts (aucun
+    succès malgré au moins ESSAIS_MORT essais) passent en fin de liste. Les statistiques
+    sont conservées dans un fichier JSON entre les exécutions.
+    """
+
+    ESSAIS_MORT = 20
+
+    def __init__(self, chemin=None):
+        self.chemin = chemin
+        self.stats = {}
+        self._verrou = threading.Lock()
+        if chemin and os.path.exists(chemin):
+            try:
+                with open(chemin, encoding='utf-8') as f:
+                    donnees = json.load(f)
+                self.stats = donnees.get('stats', {})
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"⚠️ Classement des sélecteurs illisible, il sera recréé : {str(e)}")
+
+    def ordonner(self, champ, selecteurs):
+        """Retourne les sélecteurs dans l'ordre déclaré, les sélecteurs morts en dernier"""
+        with self._verrou:
+            stats = self.stats.get(champ, {})
+
+            def est_mort(selecteur):
+                entree = stats.get(selecteur, {})
+                return entree.get('succes', 0) == 0 and entree.get('echecs', 0) >= self.ESSAIS_MORT
+
+            return sorted(selecteurs, key=est_mort)
+
+    def enregistrer(self, champ, gagnant, echoues):
+        """Note le sélecteur qui a trouvé le champ (ou None) et ceux essayés sans succès avant lui"""
+        with self._verrou:
+            stats = self.stats.setdefault(champ, {})
+            for selecteur in echoues:
+                stats.setdefault(selecteur, {'succes': 0, 'echecs': 0})['echecs'] += 1
+            if gagnant:
+                stats.setdefault(gagnant, {'succes': 0, 'echecs': 0})['succes'] += 1
+
+    def selecteurs_morts(self, essais_min=None, ignorer=()):
+        """Sélecteurs qui n'ont jamais rien trouvé malgré au moins `essais_min` essais
+
+        Les champs de `ignorer` (facultatifs ou sans sélecteur de secours) ne sont pas
+        signalés : un lien LinkedIn absent de la plupart des profils n'est pas un sélecteur mort.
+        """
+        essais_min = essais_min or self.ESSAIS_MORT
+        with self._verrou:
+            morts = {
+                champ: sorted(s for s, entree in stats.items() if entree['succes'] == 0 and entree['echecs'] >= essais_min)
+                for champ, stats in self.stats.items()
+                if champ not in ignorer
+            }
+            return {champ: selecteurs for champ, selecteurs in morts.items() if selecteurs}
+
+    def sauvegarder(self):
+        if not self.chemin:
+            return
+        with self._verrou:
+            ecrire_json_atomique(self.chemin, {'stats': self.stats})
+
+
+def essayer_selecteurs(resolveur, champ, selecteurs, tentative):
+    """Essaie `tentative(selecteur)` sur chaque sélecteur jusqu'à obtenir une valeur non vide
+
+    Avec un resolveur, les sélecteurs morts sont essayés en dernier et le résultat est
+    enregistré ; sans resolveur, l'ordre déclaré est conservé tel quel.
+    """
+    ordre = resolveur.ordonner(champ, selecteurs) if resolveur else selecteurs
+    for position, selecteur in enumerate(ordre):
+        try:
+            valeur = tentative(selecteur)
+        except Exception:
+            valeur = None
+        if valeur:
+            if resolveur:
+                resolveur.enregistrer(champ, selecteur, ordre[:position])
+            return valeur
+    if resolveur:
+        resolveur.enregistrer(champ, None, ordre)
+    return None
+
+
+def _selection_html(soup, selecteur):
+    """Exécute un sélecteur CSS sur le HTML, un sélecteur invalide ne trouvant rien"""
+    try:
+        return soup.select(selecteur)
+    except Exception:
+        return []
+
+
+def page_necessite_javascript(html):
+    """Indique si une page de profil reçue en HTTP n'a pas son contenu rendu côté serveur"""
+    return 'section__content' not in html
+
+
+class SchemaExtraction:
+    """Schéma déclaratif des champs à extraire, compilé une fois en plan d'extraction
+
+    Le schéma décrit deux pages, 'catalogue' (une entrée par carte `conteneur`) et 'detail'
+    (une entrée pour la page). Chaque champ déclare :
+
+    - `selecteurs` : sélecteurs CSS de secours, essayés dans l'ordre déclaré (sélecteurs morts en dernier)
+    - `section` / `dans_section` : mot-clé du titre de section (sans accents) et sélecteurs
+      relatifs à son contenu, essayés avant `selecteurs` (défaut ['li'])
+    - `attribut` : attribut à lire au lieu du texte ('href', 'src'...)
+    - `commence_par` / `contient` : choisit la première ligne qui commence par ce texte ou
+      contient l'un de ces mots-clés parmi tous les éléments trouvés
+    - `retirer_prefixe`, `type` (texte, entier, nombre, url, liste), `defaut`, `facultatif`
+
+    Un nom pointé ('elements_cles.effectifs') range la valeur dans un dictionnaire imbriqué ;
+    un champ `facultatif` sans valeur est omis. Le même plan s'exécute dans le navigateur
+    (un seul execute_script) ou sur du HTML hors ligne, puis passe par le même post-traitement.
+    """
+
+    CLES = {'selecteurs', 'section', 'dans_section', 'attribut', 'commence_par', 'contient',
+            'retirer_prefixe', 'type', 'defaut', 'facultatif'}
+    TYPES = ('texte', 'entier', 'nombre', 'url', 'liste')
+
+    def __init__(self, schema):
+        self.pages = {page: self._compiler(page, definition) for page, definition in schema.items()}
+
+    @classmethod
+    def charger(cls, chemin=None):
+        """Schéma par défaut, complété ou surchargé champ par champ par un fichier JSON
+
+        Dans le fichier, un champ à null retire le champ correspondant du schéma par défaut.
+        """
+        schema = json.loads(json.dumps(SCHEMA_EXTRACTION_DEFAUT))
+        if chemin:
+            with open(chemin, encoding='utf-8') as f:
+                surcharge = json.load(f)
+            for page, definition in surcharge.items():
+                cible = schema.setdefault(page, {'champs': {}})
+                if 'conteneur' in definition:
+                    cible['conteneur'] = definition['conteneur']
+                for nom, champ in definition.get('champs', {}).items():
+                    if champ is None:
+                        cible['champs'].pop(nom, None)
+                    else:
+                        cible['champs'][nom] = champ
+            logger.info(f"🧩 Schéma d'extraction chargé depuis {chemin}")
+        return cls(schema)
+
+    def _compiler(self, page, definition):
+        champs = []
+        for nom, champ in definition.get('champs', {}).items():
+            inconnues = set(champ) - self.CLES
+            if inconnues:
+                raise ValueError(f"Schéma '{page}.{nom}' : clés inconnues {sorted(inconnues)}")
+            type_champ = champ.get('type', 'texte')
+            if type_champ not in self.TYPES:
+                raise ValueError(f"Schéma '{page}.{nom}' : type '{type_champ}' inconnu (attendu : {', '.join(self.TYPES)})")
+            if not champ.get('selecteurs') and not champ.get('section'):
+                raise ValueError(f"Schéma '{page}.{nom}' : 'selecteurs' ou 'section' est requis")
+            champs.append({
+                'nom': nom,
+                'selecteurs': list(champ.get('selecteurs', [])),
+                'section': normaliser_titre(champ['section']) if champ.get('section') else None,
+                'dans_section': list(champ.get('dans_section', ['li'])),
+                'attribut': champ.get('attribut'),
+                'tous': type_champ == 'liste' or bool(champ.get('commence_par') or champ.get('contient')),
+                'commence_par': champ.get('commence_par'),
+                'contient': [mot.lower() for mot in champ.get('contient', [])],
+                'retirer_prefixe': champ.get('retirer_prefixe'),
+                'type': type_champ,
+                'defaut': champ.get('defaut'),
+                'facultatif': bool(champ.get('facultatif')),
+            })
+        return {'conteneur': definition.get('conteneur'), 'champs': champs}
+
+    def champs_sans_secours(self):
+        """Champs facultatifs ou à un seul sélecteur, dont l'absence n'indique pas un sélecteur mort"""
+        return {
+            champ['nom']
+            for plan in self.pages.values()
+            for champ in plan['champs']
+            if champ['facultatif'] or len(champ['selecteurs']) <= 1
+        }
+
+    def extraire_navigateur(self, driver, page, resolveur=None, url_page=None, racine=None, debut=0):
+        """Applique le plan de `page` dans le navigateur en un seul execute_script
+
+        `racine` limite l'extraction à un élément (une carte du catalogue) ; sinon le plan
+        s'applique à chaque `conteneur` de la page à partir de `debut`, ou à la page entière.
+        """
+        plan = self.pages[page]
+        # Les sélecteurs sont transmis dans l'ordre du résolveur (sélecteurs morts en dernier)
+        ordres = {
+            champ['nom']: resolveur.ordonner(champ['nom'], champ['selecteurs']) if resolveur else champ['selecteurs']
+            for champ in plan['champs']
+        }
+        plan_ordonne = {
+            'conteneur': resolveur.ordonner('profils', plan['conteneur']) if resolveur and plan['conteneur'] else plan['conteneur'],
+            'champs': [{**champ, 'selecteurs': ordres[champ['nom']]} for champ in plan['champs']],
+        }
+        bruts = driver.execute_script(SCRIPT_SCHEMA, plan_ordonne, racine, debut) or []
+
+        base = url_page or f"{URL_SITE}/"
+        resultats = []
+        for brut in bruts:
+            if resolveur:
+                for nom, gagnant in brut.get('_gagnants', {}).items():
+                    ordre = ordres[nom]
+                    resolveur.enregistrer(nom, gagnant, ordre[:ordre.index(gagnant)] if gagnant else ordre)
+            resultats.append(self._finaliser(plan, brut, base))
+        return resultats
+
+    def extraire_html(self, html, page, url_page=None, resolveur=None):
+        """Applique le plan de `page` à du HTML (page_source, réponse HTTP ou fichier sauvegardé)"""
+        plan = self.pages[page]
+        soup = BeautifulSoup(html, 'html.parser')
+        sections = localiser_sections_html(soup)
+
+        if plan['conteneur']:
+            racines = essayer_selecteurs(
+                resolveur, 'profils', plan['conteneur'], lambda selecteur: _selection_html(soup, selecteur)
+            ) or []
+        else:
+            racines = [soup]
+
+        def lire(element, champ):
+            return element.get(champ['attribut']) if champ['attribut'] else texte_noeud(element)
+
+        def extraire(conteneur, selecteur, champ):
+            elements = _selection_html(conteneur, selecteur)
+            if champ['tous']:
+                return [valeur for valeur in (lire(element, champ) for element in elements) if valeur] or None
+            # Comme querySelector : seul le premier élément compte
+            return (lire(elements[0], champ) or None) if elements else None
+
+        base = url_page or f"{URL_SITE}/"
+        resultats = []
+        for racine in racines:
+            brut = {}
+            for champ in plan['champs']:
+                trouve = None
+                if champ['section']:
+                    contenu = next((noeud for titre, noeud in sections.items() if champ['section'] in titre), None)
+                    for selecteur in (champ['dans_section'] if contenu is not None else []):
+                        trouve = extraire(contenu, selecteur, champ)
+                        if trouve:
+                            break
+                if not trouve and champ['selecteurs']:
+                    trouve = essayer_selecteurs(
+                        resolveur, champ['nom'], champ['selecteurs'],
+                        lambda selecteur, champ=champ: extraire(racine, selecteur, champ)
+                    )
+                brut[champ['nom']] = trouve
+            resultats.append(self._finaliser(plan, brut, base))
+        return resultats
+
+    @staticmethod
+    def _convertir(valeur, type_champ, base):
+        if type_champ == 'url':
+            return urllib.parse.urljoin(base, valeur)
+        if type_champ in ('entier', 'nombre'):
+            nombre = re.search(r'\d[\d\s\u202f\xa0]*(?:[.,]\d+)?', valeur)
+            if not nombre:
+                return None
+            chiffres = re.sub(r'[\s\u202f\xa0]', '', nombre.group()).replace(',', '.')
+            return int(float(chiffres)) if type_champ == 'entier' else float(chiffres)
+        return valeur
+
+    def _finaliser(self, plan, brut, base):
+        """Post-traitement commun : choix de ligne, préfixe, type, défaut et imbrication"""
+        resultat = {}
+        for champ in plan['champs']:
+            valeur = brut.get(champ['nom'])
+            if isinstance(valeur, list) and champ['type'] != 'liste':
+                lignes = [
+                    ligne for ligne in valeur
+                    if (not champ['commence_par'] or ligne.startswith(champ['commence_par']))
+                    and (not champ['contient'] or any(mot in ligne.lower() for mot in champ['contient']))
+                ]
+                valeur = lignes[0] if lignes else None
+
+            valeurs = valeur if isinstance(valeur, list) else [valeur]
+            if champ['retirer_prefixe']:
+                valeurs = [v[len(champ['retirer_prefixe']):] if v and v.startswith(champ['retirer_prefixe']) else v for v in valeurs]
+            valeurs = [self._convertir(v.strip(), champ['type'], base) if v else None for v in valeurs]
+            valeur = valeurs if champ['type'] == 'liste' else valeurs[0]
+
+            if valeur in (None, '', []):
+                valeur = champ['defaut']
+
+            *parents, feuille = champ['nom'].split('.')
+            cible = resultat
+            for parent in parents:
+                cible = cible.setdefault(parent, {})
+            if valeur is None and champ['facultatif']:
+                continue
+            cible[feuille] = valeur
+        return resultat
+
+
+SCHEMA_PAR_DEFAUT = SchemaExtraction(SCHEMA_EXTRACTION_DEFAUT)
+
+
+def extraire_cartes_html(html, url_page=None, resolveur=None, schema=None):
+    """Extrait les cartes du catalogue d'un fragment HTML, avec les mêmes sélecteurs de secours"""
+    return [{'index': None, **carte} for carte in (schema or SCHEMA_PAR_DEFAUT).extraire_html(html, 'catalogue', url_page, resolveur)]
+
+
+def fragments_html_reponse(reponse):
+    """Retourne le HTML porté par une réponse XHR, qu'elle soit en HTML brut ou en JSON"""
+    if 'json' not in reponse.headers.get('Content-Type', ''):
+        return [reponse.text]
+
+    fragments = []
+
+    def parcourir(valeur):
+        if isinstance(valeur, str):
+            if '<' in valeur:
+                fragments.append(valeur)
+        elif isinstance(valeur, dict):
+            for sous_valeur in valeur.values():
+                parcourir(sous_valeur)
+        elif isinstance(valeur, list):
+            for sous_valeur in valeur:
+                parcourir(sous_valeur)
+
+    parcourir(reponse.json())
+    return fragments
+
+
+# Noms usuels des paramètres de pagination, et pas associé
+PARAMETRES_PAGE = ('page', 'p', 'pagenumber', 'page_number', 'numpage')
+PARAMETRES_DECALAGE = ('offset', 'start', 'from', 'skip', 'debut')
+
+
+def analyser_pagination(url, corps):
+    """Repère le paramètre numérique de pagination dans l'URL ou le corps d'une requête XHR
+
+    Retourne (emplacement, nom, valeur) avec emplacement 'url' ou 'corps', ou None si aucun
+    paramètre ne porte un nom de pagination connu : un autre paramètre numérique (catégorie,
+    identifiant de fiche...) ferait parcourir un autre catalogue, on revient alors aux clics.
+    """
+    for emplacement, paires in (
+        ('url', urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query)),
+        ('corps', urllib.parse.parse_qsl(corps or '')),
+    ):
+        for nom, valeur in paires:
+            if valeur.isdigit() and nom.lower() in PARAMETRES_PAGE + PARAMETRES_DECALAGE:
+                return emplacement, nom, int(valeur)
+    return None
+
+
+def remplacer_parametre(url, corps, emplacement, nom, valeur):
+    """Retourne (url, corps) avec le paramètre de pagination remplacé par `valeur`"""
+    if emplacement == 'url':
+        morceaux = urllib.parse.urlsplit(url)
+        paires = [(n, str(valeur) if n == nom else v) for n, v in urllib.parse.parse_qsl(morceaux.query)]
+        return urllib.parse.urlunsplit(morceaux._replace(query=urllib.parse.urlencode(paires))), corps
+    paires = [(n, str(valeur) if n == nom else v) for n, v in urllib.parse.parse_qsl(corps)]
+    return url, urllib.parse.urlencode(paires)
+
+
+def parser_profil_detail_html(html, url_page=None, resolveur=None, schema=None):
+    """Extrait tous les champs détaillés d'un profil à partir de son HTML
+
+    `html` peut provenir de `driver.page_source` ou d'un fichier sauvegardé. Les champs sont
+    ceux de la page 'detail' du schéma ; avec le schéma par défaut, les liens LinkedIn sont
+    renvoyés en absolu sous 'lien_forward' et 'lien_linkedin_direct'.
+    """
+    return (schema or SCHEMA_PAR_DEFAUT).extraire_html(html, 'detail', url_page, resolveur)[0]
+
+
+# Nombre maximal de sauts suivis pour résoudre un lien forward/
+MAX_REDIRECTIONS = 10
+
+
+def est_url_linkedin(url):
+    hote = urllib.parse.urlsplit(url).netloc.lower()
+    return hote == "linkedin.com" or hote.endswith(".linkedin.com")
+
+
+def cible_meta_refresh(html, url_page):
+    """Retourne la cible d'une redirection <meta http-equiv="refresh">, s'il y en a une"""
+    meta = BeautifulSoup(html, 'html.parser').find(
+        'meta', attrs={'http-equiv': lambda valeur: valeur and valeur.lower() == 'refresh'}
+    )
+    if not meta or 'url=' not in meta.get('content', '').lower():
+        return None
+    contenu = meta['content']
+    cible = contenu[contenu.lower().index('url=') + 4:].strip().strip("'\"")
+    return urllib.parse.urljoin(url_page, cible)
+
+
+def extraire_url_linkedin(final_url):
+    """Déduit l'URL LinkedIn du profil depuis l'URL atteinte après redirection"""
+    # Si c'est une URL d'authentification LinkedIn, extraire l'URL de redirection
+    if "linkedin.com/authwall" in final_url or "sessionRedirect" in final_url:
+        # Extraire l'URL de redirection depuis les paramètres
+        if "sessionRedirect=" in final_url:
+            redirect_param = final_url.split("sessionRedirect=")[1]
+            if "%3F" in redirect_param:
+                redirect_param = redirect_param.split("%3F")[0]
+            linkedin_url = urllib.parse.unquote(redirect_param)
+            logger.info(f"✅ URL LinkedIn extraite depuis authwall : {linkedin_url}")
+            return linkedin_url
+        logger.info(f"✅ URL LinkedIn détectée : {final_url}")
+        return final_url
+    if "linkedin.com/in/" in final_url:
+        # URL LinkedIn directe - nettoyer les paramètres
+        linkedin_url = final_url.split("?")[0]
+        logger.info(f"✅ URL LinkedIn finale obtenue : {linkedin_url}")
+        return linkedin_url
+    logger.warning(f"⚠️ URL non-LinkedIn détectée : {final_url}")
+    return final_url
+
+
+class NavigateurALaDemande:
+    """Navigateur créé seulement au premier usage, pour les workers qui n'en ont souvent pas besoin"""
+
+    def __init__(self, fabrique):
+        self._fabrique = fabrique
+        self._driver = None
+        self._verrou = threading.Lock()
+
+    def __getattr__(self, nom):
+        with self._verrou:
+            if self._driver is None:
+                self._driver = self._fabrique()
+        return getattr(self._driver, nom)
+
+    def quit(self):
+        if self._driver is not None:
+            self._driver.quit()
+
+
+class BudgetProfilEpuise(TimeoutException):
+    """Le budget de temps alloué à un profil est consommé : le profil est remis à la fin du run"""
+
+
+class ProfilIncomplet(Exception):
+    """La page de profil n'a livré aucun champ (chargement interrompu, session perdue...)"""
+
+
+class PolitiqueReessai:
+    """Nouvelles tentatives avec attente exponentielle pour les erreurs passagères
+
+    Ne sont retentées que les erreurs passagères : délais dépassés (hors budget du profil
+    épuisé), erreurs de connexion (requests, chromedriver ou page en net::ERR_...) et pages
+    vides. Les autres erreurs WebDriver (argument invalide, onglet ou élément introuvable...)
+    sont déterministes et propagées tout de suite. L'attente double à chaque tentative, bornée par
+    `delai_max`, avec une gigue pour ne pas resynchroniser les workers.
+    """
+
+    def __init__(self, max_tentatives=3, delai_initial=2.0, delai_max=30.0, budget_profil=120.0):
+        self.max_tentatives = max(1, max_tentatives)
+        self.delai_initial = delai_initial
+        self.delai_max = delai_max
+        self.budget_profil = budget_profil
+
+    ERREURS_PASSAGERES = (TimeoutException, requests.Timeout, requests.ConnectionError, ConnectionError, ProfilIncomplet)
+
+    @classmethod
+    def est_reessayable(cls, erreur):
+        if isinstance(erreur, BudgetProfilEpuise):
+            return False
+        if isinstance(erreur, cls.ERREURS_PASSAGERES):
+            return True
+        # Échec réseau du chargement d'une page dans Chrome (connexion coupée, DNS...)
+        return isinstance(erreur, WebDriverException) and 'net::ERR_' in str(erreur.msg or '')
+
+    def delai(self, tentative):
+        return min(self.delai_max, self.delai_initial * 2 ** (tentative - 1)) * random.uniform(0.5, 1.0)
+
+    def executer(self, action, description, attentes=None):
+        """Exécute `action()` jusqu'à `max_tentatives` fois ; l'erreur finale est propagée"""
+        for tentative in range(1, self.max_tentatives + 1):
+            try:
+                return action()
+            except Exception as e:
+                if not self.est_reessayable(e) or tentative == self.max_tentatives:
+                    raise
+                delai = self.delai(tentative)
+                restant = attentes.verifier_echeance() if attentes else None
+                if restant is not None and restant <= delai:
+                    raise BudgetProfilEpuise(f"budget de temps épuisé après {tentative} tentatives : {str(e)}") from e
+                logger.warning(f"🔁 {description} : {str(e)} - tentative {tentative + 1}/{self.max_tentatives} dans {delai:.1f}s")
+                time.sleep(delai)
+
+
+class AttentesAdaptatives:
+    """Attentes conditionnelles bornées par un délai, avec histogramme des durées réelles
+
+    Chaque attente porte un nom (ex. 'connexion_valider') ; sa durée effective est
+    enregistrée pour pouvoir résumer en fin d'exécution où le temps d'attente est passé.
+    """
+
+    BORNES_HISTOGRAMME = (0.1, 0.25, 0.5, 1, 2, 5, 10)
+
+    def __init__(self, timeout=15, intervalle=0.1):
+        self.timeout = timeout
+        self.intervalle = intervalle
+        self.durees = defaultdict(list)
+        self.expirations = defaultdict(int)
+        self._verrou = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def echeance(self, secondes):
+        """Borne toutes les attentes du thread courant par un budget de temps global"""
+        self._local.echeance = time.monotonic() + secondes
+        try:
+            yield
+        finally:
+            self._local.echeance = None
+
+    def verifier_echeance(self):
+        """Lève BudgetProfilEpuise si le budget du thread courant est consommé, retourne le temps restant"""
+        echeance = getattr(self._local, 'echeance', None)
+        if echeance is None:
+            return None
+        restant = echeance - time.monotonic()
+        if restant <= 0:
+            raise BudgetProfilEpuise("budget de temps du profil épuisé")
+        return restant
+
+    def attendre(self, nom, driver, condition, timeout=None):
+        """Attend que `condition(driver)` soit vraie, retourne son résultat ou None à l'expiration
+
+        Sous une `echeance`, le délai est réduit au temps restant et BudgetProfilEpuise est
+        levée une fois le budget consommé.
+        """
+        delai = timeout or self.timeout
+        restant = self.verifier_echeance()
+        if restant is not None:
+            delai = min(delai, restant)
+        debut = time.monotonic()
+        try:
+            return WebDriverWait(driver, delai, poll_frequency=self.intervalle).until(condition)
+        except TimeoutException:
+            with self._verrou:
+                self.expirations[nom] += 1
+            logger.debug(f"⏱️ Attente '{nom}' expirée après {delai:.1f}s")
+            self.verifier_echeance()
+            return None
+        finally:
+            with self._verrou:
+                self.durees[nom].append(time.monotonic() - debut)
+
+    @staticmethod
+    def document_pret(driver):
+        return driver.execute_script("return document.readyState") == "complete"
+
+    @staticmethod
+    def element_present(selecteur):
+        return EC.presence_of_element_located((By.CSS_SELECTOR, selecteur))
+
+    @staticmethod
+    def contenu_pret(selecteur):
+        """Vraie dès que le document est chargé et que le sélecteur trouve un élément (un seul aller-retour)"""
+        return lambda driver: driver.execute_script(
+            "return document.readyState === 'complete' && document.querySelector(arguments[0]) !== null;",
+            selecteur
+        )
+
+    @staticmethod
+    def url_contient(fragment):
+        return lambda driver: fragment in driver.current_url.lower()
+
+    @staticmethod
+    def url_ne_contient_plus(fragment):
+        return lambda driver: fragment not in driver.current_url.lower()
+
+    @staticmethod
+    def nombre_elements_change(selecteur, nombre_initial):
+        """Vraie dès que le nombre d'éléments correspondant au sélecteur a changé"""
+        def condition(driver):
+            nombre = driver.execute_script(
+                "return document.querySelectorAll(arguments[0]).length", selecteur
+            )
+            return nombre if nombre != nombre_initial else False
+        return condition
+
+    @staticmethod
+    def reseau_inactif(calme=0.5):
+        """Vraie quand le document est chargé et qu'aucune ressource n'est arrivée depuis `calme` secondes"""
+        etat = {'nombre': None, 'depuis': time.monotonic()}
+
+        def condition(driver):
+            pret, nombre, actives = driver.execute_script(
+                "return [document.readyState, performance.getEntriesByType('resource').length,"
+                " window.jQuery ? window.jQuery.active : 0];"
+            )
+            maintenant = time.monotonic()
+            if nombre != etat['nombre'] or actives:
+                etat['nombre'] = nombre
+                etat['depuis'] = maintenant
+                return False
+            return pret == "complete" and maintenant - etat['depuis'] >= calme
+        return condition
+
+    def resume(self):
+        """Retourne le tableau des attentes : nombre, total, médiane, max, expirations et histogramme"""
+        with self._verrou:
+            durees = {nom: sorted(valeurs) for nom, valeurs in self.durees.items()}
+            expirations = dict(self.expirations)
+
+        entetes = [f"<={borne}s" for borne in self.BORNES_HISTOGRAMME] + [f">{self.BORNES_HISTOGRAMME[-1]}s"]
+        lignes = [f"{'attente':<28} {'n':>5} {'total':>8} {'p50':>6} {'max':>6} {'exp':>4}  " + " ".join(f"{e:>7}" for e in entetes)]
+        for nom, valeurs in sorted(durees.items(), key=lambda item: -sum(item[1])):
+            compteurs = [0] * (len(self.BORNES_HISTOGRAMME) + 1)
+            for valeur in valeurs:
+                position = next((i for i, borne in enumerate(self.BORNES_HISTOGRAMME) if valeur <= borne), len(self.BORNES_HISTOGRAMME))
+                compteurs[position] += 1
+            lignes.append(
+                f"{nom:<28} {len(valeurs):>5} {sum(valeurs):>7.1f}s {valeurs[len(valeurs) // 2]:>5.2f}s {valeurs[-1]:>5.2f}s {expirations.get(nom, 0):>4}  "
+                + " ".join(f"{c:>7}" for c in compteurs)
+            )
+        return "\n".join(lignes)
+
+
+class ChronometrePhases:
+    """Spans de durée autour de chaque phase du run et de chaque profil
+
+    Chaque span terminé est écrit en une ligne JSON (phase, début, durée, statut, thread,
+    phase parente et attributs) si un fichier est fourni, et conservé pour le tableau de fin
+    de run : nombre, total, p50, p95, max et échecs par phase.
+    """
+
+    def __init__(self, chemin=None):
+        self.durees = defaultdict(list)
+        self.echecs = defaultdict(int)
+        self._verrou = threading.Lock()
+        self._local = threading.local()
+        self._fichier = open(chemin, 'a', encoding='utf-8') if chemin else None
+
+    @contextmanager
+    def span(self, phase, **attributs):
+        """Mesure le bloc ; le dict produit peut recevoir des attributs ou un 'statut'"""
+        pile = self._local.__dict__.setdefault('pile', [])
+        span = {'phase': phase, 'debut': datetime.now().isoformat(), 'statut': 'ok',
+                'thread': threading.current_thread().name, 'parent': pile[-1] if pile else None, **attributs}
+        pile.append(phase)
+        debut = time.monotonic()
+        try:
+            yield span
+        except BaseException as e:
+            span['statut'] = 'erreur'
+            span['erreur'] = f"{type(e).__name__}: {str(e)}"[:300]
+            raise
+        finally:
+            pile.pop()
+            span['duree_s'] = round(time.monotonic() - debut, 4)
+            with self._verrou:
+                self.durees[phase].append(span['duree_s'])
+                if span['statut'] != 'ok':
+                    self.echecs[phase] += 1
+                if self._fichier:
+                    self._fichier.write(json.dumps(span, ensure_ascii=False, default=str) + "\n")
+                    self._fichier.flush()
+
+    def fermer(self):
+        with self._verrou:
+            if self._fichier:
+                self._fichier.close()
+                self._fichier = None
+
+    def resume(self):
+        """Retourne le tableau des phases, de la plus coûteuse à la moins coûteuse"""
+        with self._verrou:
+            durees = {phase: sorted(valeurs) for phase, valeurs in self.durees.items()}
+            echecs = dict(self.echecs)
+
+        lignes = [f"{'phase':<30} {'n':>6} {'total':>9} {'p50':>7} {'p95':>7} {'max':>7} {'échecs':>7}"]
+        for phase, valeurs in sorted(durees.items(), key=lambda item: -sum(item[1])):
+            p95 = valeurs[min(len(valeurs) - 1, int(0.95 * len(valeurs)))]
+            lignes.append(
+                f"{phase:<30} {len(valeurs):>6} {sum(valeurs):>8.1f}s {valeurs[len(valeurs) // 2]:>6.2f}s "
+                f"{p95:>6.2f}s {valeurs[-1]:>6.2f}s {echecs.get(phase, 0):>7}"
+            )
+        return "\n".join(lignes)
+
+
+def phase_chronometree(phase):
+    """Décorateur de méthode du scraper : chaque appel devient un span `phase`
+
+    Un retour False (convention des méthodes du scraper pour un échec) est noté 'echec'.
+    """
+    def decorateur(methode):
+        @functools.wraps(methode)
+        def enveloppe(self, *args, **kwargs):
+            with self.phases.span(phase) as span:
+                resultat = methode(self, *args, **kwargs)
+                if resultat is False:
+                    span['statut'] = 'echec'
+                return resultat
+        return enveloppe
+    return decorateur
+
+
+class ProfileurWebDriver:
+    """Compte et chronomètre chaque commande WebDriver (aller-retour vers chromedriver)
+
+    Toutes les commandes d'un navigateur, celles de ses éléments comprises, passent par
+    `driver.execute` : c'est lui qui est instrumenté, le driver restant un vrai WebDriver pour
+    WebDriverWait et ActionChains. Chaque commande est rattachée à la méthode du scraper la
+    plus proche dans la pile d'appels (fonctions locales et aides de chargement ignorées).
+    """
+
+    # Aides génériques dont on préfère imputer les commandes à la méthode appelante
+    METHODES_INTERMEDIAIRES = {'charger_page', 'cliquer_voir_plus'}
+    PROFONDEUR_MAX = 40
+
+    def __init__(self, chemin=None):
+        self.chemin = chemin
+        self.statistiques = defaultdict(lambda: [0, 0.0, 0.0])
+        self._verrou = threading.Lock()
+
+    def instrumenter(self, driver):
+        execute = driver.execute
+
+        def execute_compte(commande, params=None):
+            nom = self.nom_commande(commande, params)
+            methode = self.methode_appelante()
+            debut = time.perf_counter()
+            try:
+                return execute(commande, params)
+            finally:
+                duree = time.perf_counter() - debut
+                with self._verrou:
+                    statistique = self.statistiques[(nom, methode)]
+                    statistique[0] += 1
+                    statistique[1] += duree
+                    statistique[2] = max(statistique[2], duree)
+
+        driver.execute = execute_compte
+        return driver
+
+    @staticmethod
+    def nom_commande(commande, params):
+        """get_attribute et is_displayed sont des scripts préfixés par leur nom : on les distingue"""
+        if params and isinstance(params.get('script'), str):
+            entete = re.match(r'/\* (\w+) \*/', params['script'])
+            if entete:
+                return entete.group(1)
+        return commande
+
+    def methode_appelante(self):
+        cadre = sys._getframe(2)
+        for _ in range(self.PROFONDEUR_MAX):
+            if cadre is None:
+                break
+            code = cadre.f_code
+            if (code.co_name not in self.METHODES_INTERMEDIAIRES
+                    and '<' not in getattr(code, 'co_qualname', code.co_name)
+                    and isinstance(cadre.f_locals.get('self'), TonyCompletIntegratedScraper)):
+                return code.co_name
+            cadre = cadre.f_back
+        return '(hors scraper)'
+
+    def _cumuler(self, indice):
+        """Agrège les statistiques par commande (indice 0) ou par méthode (indice 1)"""
+        totaux = defaultdict(lambda: [0, 0.0, 0.0])
+        with self._verrou:
+            for cle, (nombre, total, maximum) in self.statistiques.items():
+                cumul = totaux[cle[indice]]
+                cumul[0] += nombre
+                cumul[1] += total
+                cumul[2] = max(cumul[2], maximum)
+        return sorted(totaux.items(), key=lambda item: -item[1][1])
+
+    def resume(self, max_paires=15):
+        """Tableaux par commande, par méthode et des paires (méthode, commande) les plus coûteuses"""
+        def tableau(titre, lignes):
+            sortie = [f"{titre:<40} {'n':>7} {'total':>9} {'moyenne':>9} {'max':>8}"]
+            for nom, (nombre, total, maximum) in lignes:
+                sortie.append(f"{nom:<40} {nombre:>7} {total:>8.1f}s {1000 * total / nombre:>7.1f}ms {maximum:>7.2f}s")
+            return sortie
+
+        with self._verrou:
+            paires = sorted(self.statistiques.items(), key=lambda item: -item[1][1])[:max_paires]
+        lignes = tableau("commande", self._cumuler(0)) + [""]
+        lignes += tableau("méthode du scraper", self._cumuler(1)) + [""]
+        lignes += tableau("méthode / commande", [(f"{methode} / {nom}", valeurs) for (nom, methode), valeurs in paires])
+        return "\n".join(lignes)
+
+    def sauvegarder(self):
+        if not self.chemin:
+            return
+        with self._verrou:
+            profil = [
+                {'commande': nom, 'methode': methode, 'nombre': nombre,
+                 'total_s': round(total, 4), 'max_s': round(maximum, 4)}
+                for (nom, methode), (nombre, total, maximum)
+                in sorted(self.statistiques.items(), key=lambda item: -item[1][1])
+            ]
+        ecrire_json_atomique(self.chemin, profil)
+
+
+class MetriquesPrometheus:
+    """Compteurs et histogrammes du run au format texte de Prometheus
+
+    Exposés sur un endpoint HTTP local `/metrics` (thread serveur dédié) et/ou réécrits
+    atomiquement dans un fichier pour le collecteur textfile de node_exporter, au plus une
+    fois par `intervalle_fichier` secondes. Les valeurs déjà cumulées ailleurs (attentes du
+    limiteur, attentes adaptatives) sont lues par `collecteur` au moment de l'exposition.
+    """
+
+    PREFIXE = "tony_"
+    DEFINITIONS = {
+        'profils_termines_total': ('counter', "Profils enrichis et enregistrés"),
+        'profils_echoues_total': ('counter', "Échecs d'enrichissement d'un profil (reprises comprises)"),
+        'profils_en_echec': ('gauge', "Profils actuellement en échec, en attente de reprise"),
+        'pages_chargees_total': ('counter', "Pages chargées, par source (navigateur ou http)"),
+        'redirections_resolues_total': ('counter', "Liens forward/ résolus, par origine (cache, http, navigateur)"),
+        'octets_telecharges_total': ('counter', "Octets reçus par la session HTTP (hors navigateur)"),
+        'attente_secondes_total': ('counter', "Temps passé à attendre, par type (debit, page)"),
+        'latence_profil_secondes': ('histogram', "Durée d'enrichissement d'un profil, tentatives comprises"),
+        'derniere_activite_timestamp_secondes': ('gauge', "Horodatage Unix du dernier profil terminé ou échoué"),
+        'debut_timestamp_secondes': ('gauge', "Horodatage Unix du démarrage du run"),
+    }
+    BORNES_LATENCE = (1, 2, 5, 10, 20, 30, 60, 120, 300)
+
+    def __init__(self, chemin_fichier=None, intervalle_fichier=15.0, collecteur=None):
+        self.chemin_fichier = chemin_fichier
+        self.intervalle_fichier = intervalle_fichier
+        self.collecteur = collecteur
+        self.valeurs = defaultdict(float)
+        self.histogrammes = defaultdict(lambda: [[0] * len(self.BORNES_LATENCE), 0, 0.0])
+        self.serveur = None
+        self._derniere_ecriture = 0.0
+        self._verrou = threading.Lock()
+        self.definir('debut_timestamp_secondes', time.time())
+        # Séries présentes dès le départ, pour que rate() et les alertes aient une base
+        for nom in ('profils_termines_total', 'profils_echoues_total', 'octets_telecharges_total'):
+            self.definir(nom, 0)
+
+    def incrementer(self, nom, valeur=1.0, **etiquettes):
+        with self._verrou:
+            self.valeurs[(nom, tuple(sorted(etiquettes.items())))] += valeur
+
+    def definir(self, nom, valeur, **etiquettes):
+        with self._verrou:
+            self.valeurs[(nom, tuple(sorted(etiquettes.items())))] = valeur
+
+    def observer(self, nom, valeur):
+        with self._verrou:
+            compteurs, _, _ = histogramme = self.histogrammes[nom]
+            for position, borne in enumerate(self.BORNES_LATENCE):
+                if valeur <= borne:
+                    compteurs[position] += 1
+            histogramme[1] += 1
+            histogramme[2] += valeur
+
+    @staticmethod
+    def _etiquettes(etiquettes):
+        def echapper(valeur):
+            return str(valeur).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+        if not etiquettes:
+            return ""
+        return "{" + ",".join(f'{cle}="{echapper(valeur)}"' for cle, valeur in etiquettes) + "}"
+
+    def exposition(self):
+        """Retourne toutes les métriques au format texte d'exposition de Prometheus (0.0.4)"""
+        collectees = list(self.collecteur()) if self.collecteur else []
+        with self._verrou:
+            series = defaultdict(list)
+            for (nom, etiquettes), valeur in self.valeurs.items():
+                series[nom].append((etiquettes, valeur))
+            for nom, etiquettes, valeur in collectees:
+                series[nom].append((tuple(sorted(etiquettes.items())), valeur))
+            histogrammes = {nom: (list(compteurs), nombre, somme)
+                            for nom, (compteurs, nombre, somme) in self.histogrammes.items()}
+
+        lignes = []
+        for nom, (type_metrique, aide) in self.DEFINITIONS.items():
+            if nom not in series and nom not in histogrammes:
+                continue
+            complet = self.PREFIXE + nom
+            lignes += [f"# HELP {complet} {aide}", f"# TYPE {complet} {type_metrique}"]
+            if type_metrique == 'histogram':
+                compteurs, nombre, somme = histogrammes[nom]
+                for borne, compte in zip(self.BORNES_LATENCE, compteurs):
+                    lignes.append(f'{complet}_bucket{{le="{borne}"}} {compte}')
+                lignes += [f'{complet}_bucket{{le="+Inf"}} {nombre}', f"{complet}_sum {somme:.6f}",
+                           f"{complet}_count {nombre}"]
+                continue
+            for etiquettes, valeur in sorted(series[nom]):
+                lignes.append(f"{complet}{self._etiquettes(etiquettes)} {float(valeur)!r}")
+        return "\n".join(lignes) + "\n"
+
+    def servir(self, port, adresse="127.0.0.1"):
+        """Démarre l'endpoint /metrics dans un thread démon"""
+        metriques = self
+
+        class GestionnaireMetriques(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                corps = metriques.exposition().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(corps)))
+                self.end_headers()
+                self.wfile.write(corps)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.serveur = ThreadingHTTPServer((adresse, port), GestionnaireMetriques)
+        self.serveur.daemon_threads = True
+        threading.Thread(target=self.serveur.serve_forever, name="metriques", daemon=True).start()
+        logger.info(f"📡 Métriques exposées sur http://{adresse}:{self.serveur.server_address[1]}/metrics")
+
+    def publier(self, forcer=False):
+        """Réécrit le fichier textfile si l'intervalle est écoulé (ou si `forcer`)"""
+        if not self.chemin_fichier or (not forcer and time.monotonic() - self._derniere_ecriture < self.intervalle_fichier):
+            return
+        self._derniere_ecriture = time.monotonic()
+        try:
+            ecrire_fichier_atomique(self.chemin_fichier, self.exposition())
+        except OSError as e:
+            logger.warning(f"⚠️ Écriture des métriques impossible ({self.chemin_fichier}) : {str(e)}")
+
+    def arreter(self):
+        self.publier(forcer=True)
+        if self.serveur:
+            self.serveur.shutdown()
+            self.serveur.server_close()
+            self.serveur = None
+
+
+class LimiteurDebit:
+    """Budget de requêtes partagé par tous les navigateurs et sessions HTTP
+
+    Chaque hôte a son seau à jetons (débit en requêtes/seconde et rafale) ; les hôtes non
+    déclarés suivent le débit par défaut. Un sémaphore borne le nombre de requêtes en vol.
+    Le jeton est pris avant la place : un hôte en pause n'occupe aucune place pendant son
+    attente. Une réponse 429/5xx, un délai dépassé ou une réponse plus lente que
+    `seuil_lenteur` divise par deux le débit de l'hôte
+    (avec une pause, celle de Retry-After si fournie) ; chaque réponse normale le fait ensuite
+    remonter par paliers vers sa valeur nominale.
+    """
+
+    DEBIT_MINIMAL = 0.1
+
+    def __init__(self, debit_defaut=1.0, debits_hotes=None, max_simultanees=8, seuil_lenteur=8.0):
+        self.debit_defaut = debit_defaut
+        self.debits_hotes = debits_hotes or {}
+        self.seuil_lenteur = seuil_lenteur
+        self.budgets = {}
+        self.attente_totale = defaultdict(float)
+        self.ralentissements = defaultdict(int)
+        self._verrou = threading.Lock()
+        self._simultanees = threading.BoundedSemaphore(max_simultanees)
+
+    def _budget(self, hote):
+        if hote not in self.budgets:
+            debit = self.debits_hotes.get(hote, self.debit_defaut)
+            self.budgets[hote] = {
+                'nominal': debit, 'debit': debit, 'jetons': max(1.0, debit),
+                'maj': time.monotonic(), 'pause_jusqua': 0.0,
+            }
+        return self.budgets[hote]
+
+    def _prendre_jeton(self, hote):
+        while True:
+            with self._verrou:
+                budget = self._budget(hote)
+                maintenant = time.monotonic()
+                rafale = max(1.0, budget['nominal'])
+                budget['jetons'] = min(rafale, budget['jetons'] + (maintenant - budget['maj']) * budget['debit'])
+                budget['maj'] = maintenant
+                attente = budget['pause_jusqua'] - maintenant
+                if attente <= 0 and budget['jetons'] >= 1:
+                    budget['jetons'] -= 1
+                    return
+                if attente <= 0:
+                    attente = (1 - budget['jetons']) / budget['debit']
+                self.attente_totale[hote] += attente
+            time.sleep(attente)
+
+    @contextmanager
+    def requete(self, url):
+        """Attend un jeton de l'hôte puis une place libre, et mesure la durée de la requête"""
+        hote = urllib.parse.urlsplit(url).hostname or ''
+        self._prendre_jeton(hote)
+        with self._simultanees:
+            debut = time.monotonic()
+            try:
+                yield
+            except (requests.Timeout, TimeoutException):
+                self.ralentir(hote, f"délai dépassé après {time.monotonic() - debut:.1f}s")
+                raise
+            duree = time.monotonic() - debut
+        if duree > self.seuil_lenteur:
+            self.ralentir(hote, f"réponse lente ({duree:.1f}s)")
+        else:
+            self.retablir(hote)
+
+    def signaler(self, url, statut, retry_after=None):
+        """Adapte le débit de l'hôte au code HTTP reçu"""
+        if statut == 429 or statut >= 500:
+            pause = float(retry_after) if retry_after and str(retry_after).isdigit() else None
+            self.ralentir(urllib.parse.urlsplit(url).hostname or '', f"HTTP {statut}", pause)
+
+    def ralentir(self, hote, raison, pause=None):
+        with self._verrou:
+            budget = self._budget(hote)
+            budget['debit'] = max(self.DEBIT_MINIMAL, budget['debit'] / 2)
+            budget['pause_jusqua'] = time.monotonic() + (pause if pause is not None else 1 / budget['debit'])
+            self.ralentissements[hote] += 1
+        logger.warning(f"🐢 {hote} : {raison}, débit réduit à {budget['debit']:.2f} req/s")
+
+    def retablir(self, hote):
+        with self._verrou:
+            budget = self._budget(hote)
+            budget['debit'] = min(budget['nominal'], budget['debit'] + budget['nominal'] / 10)
+
+    def resume(self):
+        with self._verrou:
+            return ", ".join(
+                f"{hote} {budget['debit']:.2f}/{budget['nominal']:.2f} req/s, "
+                f"{self.attente_totale[hote]:.1f}s d'attente, {self.ralentissements[hote]} ralentissements"
+                for hote, budget in sorted(self.budgets.items())
+            )
+
+
+class CacheRedirections:
+    """Cache disque des résolutions forward/ -> URL LinkedIn, avec durée de vie et taille maximale
+
+    Les entrées expirées sont ignorées à la lecture ; à la sauvegarde, seules les
+    `max_entrees` entrées les plus récemment utilisées sont conservées.
+    """
+
+    def __init__(self, chemin, ttl=30 * 24 * 3600, max_entrees=20000):
+        self.chemin = chemin
+        self.ttl = ttl
+        self.max_entrees = max_entrees
+        self.hits = 0
+        self.misses = 0
+        self.entrees = {}
+        self._verrou = threading.Lock()
+        if os.path.exists(chemin):
+            try:
+                with open(chemin, encoding='utf-8') as f:
+                    self.entrees = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"⚠️ Cache de redirections illisible, il sera recréé : {str(e)}")
+
+    def lire(self, url_forward):
+        maintenant = time.time()
+        with self._verrou:
+            entree = self.entrees.get(url_forward)
+            if entree and maintenant - entree['resolu_le'] <= self.ttl:
+                entree['utilise_le'] = maintenant
+                self.hits += 1
+                return entree['cible']
+            if entree:
+                del self.entrees[url_forward]
+            self.misses += 1
+            return None
+
+    def ecrire(self, url_forward, cible):
+        maintenant = time.time()
+        with self._verrou:
+            self.entrees[url_forward] = {'cible': cible, 'resolu_le': maintenant, 'utilise_le': maintenant}
+
+    def sauvegarder(self):
+        with self._verrou:
+            entrees = sorted(self.entrees.items(), key=lambda item: item[1]['utilise_le'], reverse=True)
+            self.entrees = dict(entrees[:self.max_entrees])
+            ecrire_json_atomique(self.chemin, self.entrees, indent=None)
+
+    def resume(self):
+        total = self.hits + self.misses
+        taux = 100 * self.hits / total if total else 0
+        return f"{self.hits} hits / {self.misses} misses ({taux:.0f}%), {len(self.entrees)} entrées"
+
+
+class SortieJSONL:
+    """Journal JSONL en ajout seul : chaque profil terminé est écrit dès qu'il est disponible
+
+    Les lignes sont vidées vers le système à chaque écriture et synchronisées sur disque
+    (fsync) par lots, pour qu'un arrêt brutal ne perde au plus que le dernier lot. Un journal
+    existant n'est prolongé qu'en `reprise` ; sinon il est vidé à l'ouverture.
+    """
+
+    def __init__(self, chemin, lot_fsync=20, reprise=True):
+        self.chemin = chemin
+        self.lot_fsync = lot_fsync
+        self._non_synchronises = 0
+        self._verrou = threading.Lock()
+        self._fichier = open(chemin, 'a' if reprise else 'w', encoding='utf-8')
+        # Après un crash, isoler une éventuelle dernière ligne tronquée
+        if self._fichier.tell() > 0:
+            with open(chemin, 'rb') as existant:
+                existant.seek(-1, os.SEEK_END)
+                if existant.read(1) != b"\n":
+                    self._fichier.write("\n")
+
+    @staticmethod
+    def lire(chemin):
+        """Relit les profils d'un journal, en ignorant une dernière ligne tronquée par un crash"""
+        if not os.path.exists(chemin):
+            return
+        with open(chemin, encoding='utf-8') as f:
+            for ligne in f:
+                try:
+                    yield json.loads(ligne)
+                except json.JSONDecodeError:
+                    logger.warning(f"⚠️ Ligne illisible ignorée dans {chemin}")
+
+    @staticmethod
+    def urls_deja_traitees(chemin):
+        return {profil.get('url_profil') for profil in SortieJSONL.lire(chemin)}
+
+    def ecrire(self, profil):
+        with self._verrou:
+            self._fichier.write(json.dumps(profil, ensure_ascii=False) + "\n")
+            self._fichier.flush()
+            self._non_synchronises += 1
+            if self._non_synchronises >= self.lot_fsync:
+                os.fsync(self._fichier.fileno())
+                self._non_synchronises = 0
+
+    def fermer(self):
+        with self._verrou:
+            if self._fichier.closed:
+                return
+            self._fichier.flush()
+            os.fsync(self._fichier.fileno())
+            self._fichier.close()
+
+
+class ArchivePages:
+    """Archive compressée des pages récupérées, adressée par leur contenu
+
+    Chaque HTML est stocké une seule fois, compressé en gzip, sous
+    objets/<2 premiers caractères>/<sha256>.html.gz ; le journal index.jsonl reçoit une ligne
+    par récupération (url, page 'catalogue' ou 'detail', date, empreinte, taille, source et,
+    pour le catalogue, `ordre` : 0 pour la page affichée, puis la valeur du paramètre de
+    pagination de chaque fragment XHR), ce qui permet de rejouer l'extraction sur la dernière version de chaque URL sans navigateur.
+    Plusieurs processus peuvent partager le même dossier (écritures atomiques).
+    """
+
+    def __init__(self, dossier, niveau_compression=6):
+        self.dossier = dossier
+        self.niveau_compression = niveau_compression
+        os.makedirs(os.path.join(dossier, "objets"), exist_ok=True)
+        self.chemin_index = os.path.join(dossier, "index.jsonl")
+        self._index = None
+        self._verrou = threading.Lock()
+        self.pages_ajoutees = 0
+        self.objets_ecrits = 0
+
+    def chemin_objet(self, empreinte):
+        return os.path.join(self.dossier, "objets", empreinte[:2], f"{empreinte}.html.gz")
+
+    def ajouter(self, url, page, html, source, ordre=None):
+        """Archive une page ; un contenu déjà présent n'ajoute qu'une ligne d'index"""
+        contenu = html.encode('utf-8')
+        empreinte = hashlib.sha256(contenu).hexdigest()
+        chemin = self.chemin_objet(empreinte)
+        if not os.path.exists(chemin):
+            os.makedirs(os.path.dirname(chemin), exist_ok=True)
+            ecrire_fichier_atomique(chemin, gzip.compress(contenu, self.niveau_compression, mtime=0))
+            self.objets_ecrits += 1
+        with self._verrou:
+            if self._index is None:
+                self._index = SortieJSONL(self.chemin_index)
+            self.pages_ajoutees += 1
+        entree = {
+            'url': url, 'page': page, 'recupere_le': datetime.now().isoformat(),
+            'empreinte': empreinte, 'octets': len(contenu), 'source': source,
+        }
+        if ordre is not None:
+            entree['ordre'] = ordre
+        self._index.ecrire(entree)
+
+    def lire(self, empreinte):
+        with gzip.open(self.chemin_objet(empreinte), 'rt', encoding='utf-8') as f:
+            return f.read()
+
+    def dernieres_entrees(self, page):
+        """Dernière récupération de chaque URL pour ce type de page, dans l'ordre de première récupération"""
+        entrees = {}
+        for entree in SortieJSONL.lire(self.chemin_index):
+            if entree.get('page') != page:
+                continue
+            if entree['url'] not in entrees or entree['recupere_le'] >= entrees[entree['url']]['recupere_le']:
+                entrees[entree['url']] = entree
+        return list(entrees.values())
+
+    def fermer(self):
+        with self._verrou:
+            if self._index:
+                self._index.fermer()
+                self._index = None
+
+    def resume(self):
+        return f"{self.pages_ajoutees} pages archivées, {self.objets_ecrits} nouveaux contenus dans {self.dossier}"
+
+
+def reextraire_page_archivee(chemin_objet, url_page, schema):
+    """Applique le schéma 'detail' à une page de l'archive, None si son contenu est illisible
+
+    Exécutée dans un processus d'analyse : seul le chemin de l'objet lui est transmis.
+    """
+    try:
+        with gzip.open(chemin_objet, 'rt', encoding='utf-8') as f:
+            html = f.read()
+    except (OSError, EOFError, UnicodeDecodeError):
+        return None
+    return parser_profil_detail_html(html, url_page, None, schema)
+
+
 class TonyCompletIntegratedScraper:
-    def __init__(self):
+    def __init__(self, extraction_groupee=True, extraction_hors_ligne=True, mode_http=False, concurrence=1,
+                 pagination_directe=False, pipeline=False, fichier_jsonl=None, reprise=False,
+                 incremental=False, fichier_profils_connus="profils_tony_connus.json",
+                 fichier_cookies=None, dossier_profil_chrome=None, redirections_http=True,
+                 fichier_cache_redirections="cache_redirections_tony.json", mode_leger=False,
+                 fichier_selecteurs="selecteurs_tony.json", fichier_schema=None, nombre_profils=None,
+                 position_depart=1, sans_interface=False, dossier_sortie=".", formats=("json", "csv"),
+                 debit_site=3.0, debit_autres_hotes=1.0, max_requetes_simultanees=8, max_tentatives=3,
+                 budget_profil=120.0, fichier_spans=None, fichier_profil_webdriver=None, port_metriques=None,
+                 adresse_metriques="127.0.0.1", fichier_metriques=None, dossier_archive=None):
         self.driver = None
         self.wait = None
+        self.session_http = None
+        self.attentes = AttentesAdaptatives()
+        self.phases = ChronometrePhases(fichier_spans)
+        self.profileur_webdriver = ProfileurWebDriver(fichier_profil_webdriver) if fichier_profil_webdriver else None
+        self.politique_reessai = PolitiqueReessai(max_tentatives=max_tentatives, budget_profil=budget_profil)
+        self.profils_en_echec = []
+        self._delais_chargement = {}
+        self.metriques = MetriquesPrometheus(fichier_metriques, collecteur=self.collecter_metriques)
+        self.port_metriques = port_metriques
+        self.adresse_metriques = adresse_metriques
+        self.limiteur = LimiteurDebit(
+            debit_defaut=debit_autres_hotes,
+            debits_hotes={urllib.parse.urlsplit(URL_SITE).hostname: debit_site},
+            max_simultanees=max_requetes_simultanees
+        )
         self.profils_complets = []
-        self.catalogue_url = "https://le-spot.retail-leaders.fr/fr/sheet/926247/catalog"
+        self.nb_profils_complets = 0
+        self.extraction_groupee = extraction_groupee
+        self.extraction_hors_ligne = extraction_hors_ligne
+        self.mode_http = mode_http
+        self.concurrence = max(1, concurrence)
+        self.pagination_directe = pagination_directe
+        self.pipeline = pipeline
+        self.fichier_jsonl = fichier_jsonl
+        self.reprise = reprise
+        self.sortie_jsonl = None
+        self.urls_deja_traitees = set()
+        self.incremental = incremental
+        self.fichier_profils_connus = fichier_profils_connus
+        self.profils_connus = set()
+        self.fichier_cookies = fichier_cookies
+        self.dossier_profil_chrome = dossier_profil_chrome
+        self.redirections_http = redirections_http
+        self.mode_leger = mode_leger
+        self.resolveur = ResolveurSelecteurs(fichier_selecteurs)
+        self.schema = SchemaExtraction.charger(fichier_schema)
+        self.nombre_profils = nombre_profils
+        self.position_depart = position_depart
+        self.sans_interface = sans_interface
+        self.dossier_sortie = dossier_sortie
+        self.formats = tuple(formats)
+        self.cache_redirections = CacheRedirections(fichier_cache_redirections) if fichier_cache_redirections else None
+        self.archive = ArchivePages(dossier_archive) if dossier_archive else None
+        self.catalogue_url = f"{URL_SITE}/fr/sheet/926247/catalog"
         
-    def setup_driver(self):
-        """Configure le driver Selenium"""
+    def creer_driver(self, journal_reseau=False, profil_persistant=False):
+        """Crée une instance Chrome configurée"""
         options = webdriver.ChromeOptions()
+        if profil_persistant and self.dossier_profil_chrome:
+            # Profil Chrome conservé entre les exécutions (un seul navigateur peut l'ouvrir à la fois)
+            options.add_argument(f'--user-data-dir={os.path.abspath(self.dossier_profil_chrome)}')
+        if journal_reseau:
+            # Journal des événements réseau CDP, pour retrouver la requête XHR de 'Voir plus'
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
         options.add_argument('--window-size=1920,1080')
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_argument('--disable-web-security')
@@ -61,19 +1648,156 @@ class TonyCompletIntegratedScraper:
         options.add_argument('--no-sandbox')
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
-        # options.add_argument('--headless')  # Désactivé pour voir le processus
-        self.driver = webdriver.Chrome(options=options)
+        if self.mode_leger or self.sans_interface:
+            options.add_argument('--headless=new')
+        if self.mode_leger:
+            # Navigateur léger : sans images/médias, rendu dès le DOM prêt
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_argument('--mute-audio')
+            options.page_load_strategy = 'eager'
+            options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.media_stream': 2,
+                'profile.default_content_setting_values.notifications': 2,
+                'profile.default_content_setting_values.geolocation': 2,
+            })
+        driver = webdriver.Chrome(options=options)
+        if self.profileur_webdriver:
+            self.profileur_webdriver.instrumenter(driver)
+        # Un chargement bloqué ne peut pas dépasser le budget d'un profil (réduit par charger_page)
+        driver.set_page_load_timeout(self.politique_reessai.budget_profil)
+        self._delais_chargement[id(driver)] = self.politique_reessai.budget_profil
+        
+        self.bloquer_ressources(driver)
+        return driver
+    
+    def bloquer_ressources(self, driver):
+        """En mode léger, bloque images, médias, polices et traqueurs dans l'onglet courant"""
+        if not self.mode_leger:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': URLS_BLOQUEES_MODE_LEGER})
+        except Exception as e:
+            logger.warning(f"⚠️ Blocage des ressources indisponible : {str(e)}")
+    
+    def ouvrir_onglet(self, driver):
+        """Ouvre un onglet vide et s'y place, retourne l'onglet d'origine
+
+        Les réglages réseau CDP ne valent que pour un onglet : le blocage du mode léger est
+        réappliqué à chaque nouvel onglet.
+        """
+        original_window = driver.current_window_handle
+        driver.execute_script("window.open('');")
+        driver.switch_to.window(driver.window_handles[-1])
+        self.bloquer_ressources(driver)
+        return original_window
+        
+    def setup_driver(self):
+        """Configure le driver Selenium"""
+        self.driver = self.creer_driver(journal_reseau=self.pagination_directe, profil_persistant=True)
         self.wait = WebDriverWait(self.driver, 15)
+    
+    def charger_page(self, driver, url):
+        """Charge une page dans un navigateur en respectant le budget de requêtes et de temps
+
+        Sous l'échéance d'un profil, le délai de chargement est réduit au temps restant : un
+        chargement commencé tard ne peut pas dépasser le budget du profil.
+        """
+        restant = self.attentes.verifier_echeance()
+        delai = self.politique_reessai.budget_profil if restant is None else min(restant, self.politique_reessai.budget_profil)
+        if self._delais_chargement.get(id(driver)) != delai:
+            driver.set_page_load_timeout(delai)
+            self._delais_chargement[id(driver)] = delai
+        with self.limiteur.requete(url):
+            driver.get(url)
+        self.metriques.incrementer('pages_chargees_total', source='navigateur')
+    
+    def requete_http(self, methode, url, **kwargs):
+        """Requête HTTP de la session partagée, soumise au budget de requêtes"""
+        with self.limiteur.requete(url):
+            reponse = self.session_http.request(methode, url, **kwargs)
+        self.limiteur.signaler(url, reponse.status_code, reponse.headers.get('Retry-After'))
+        self.metriques.incrementer('pages_chargees_total', source='http')
+        self.metriques.incrementer('octets_telecharges_total', len(reponse.content))
+        return reponse
+    
+    def archiver_page(self, url, page, html, source, ordre=None):
+        """Conserve le HTML récupéré dans l'archive, si elle est activée"""
+        if not self.archive or not html:
+            return
+        try:
+            self.archive.ajouter(url, page, html, source, ordre)
+        except OSError as e:
+            logger.warning(f"⚠️ Archivage impossible ({url}) : {str(e)}")
+    
+    def creer_driver_connecte(self):
+        """Crée un navigateur supplémentaire qui réutilise la session du navigateur principal"""
+        driver = self.creer_driver()
+        self.deposer_cookies(driver, self.driver.get_cookies())
+        return driver
+    
+    def deposer_cookies(self, driver, cookies):
+        """Dépose des cookies du site dans un navigateur, en ignorant ceux qui ont expiré"""
+        # Il faut être sur le domaine pour pouvoir y déposer les cookies
+        self.charger_page(driver, f"{URL_SITE}/")
+        maintenant = time.time()
+        for cookie in cookies:
+            if cookie.get('expiry') and cookie['expiry'] < maintenant:
+                continue
+            cookie_a_deposer = {
+                'name': cookie['name'],
+                'value': cookie['value'],
+                'path': cookie.get('path', '/'),
+                'secure': cookie.get('secure', False)
+            }
+            if cookie.get('expiry'):
+                cookie_a_deposer['expiry'] = int(cookie['expiry'])
+            driver.add_cookie(cookie_a_deposer)
+    
+    def session_valide(self):
+        """Sonde la session en ouvrant le catalogue : valide si le site ne renvoie pas vers la connexion"""
+        self.charger_page(self.driver, self.catalogue_url)
+        self.attentes.attendre('sonde_session', self.driver, AttentesAdaptatives.document_pret)
+        return "login" not in self.driver.current_url.lower()
+    
+    @phase_chronometree('restaurer_session')
+    def restaurer_session(self):
+        """Réutilise le profil Chrome ou les cookies sauvegardés pour éviter la connexion
+
+        Retourne True si la session est valide ; le navigateur est alors déjà sur le catalogue.
+        """
+        try:
+            if self.fichier_cookies and os.path.exists(self.fichier_cookies):
+                with open(self.fichier_cookies, encoding='utf-8') as f:
+                    self.deposer_cookies(self.driver, json.load(f))
+            elif not self.dossier_profil_chrome:
+                return False
+            
+            if self.session_valide():
+                logger.info("🍪 Session existante réutilisée, connexion évitée")
+                return True
+        except Exception as e:
+            logger.warning(f"⚠️ Impossible de réutiliser la session : {str(e)}")
+        logger.info("🔐 Session expirée, connexion nécessaire")
+        return False
+    
+    def sauvegarder_cookies(self):
+        """Enregistre les cookies de la session connectée pour les prochaines exécutions et les autres workers"""
+        if not self.fichier_cookies:
+            return
+        ecrire_json_atomique(self.fichier_cookies, self.driver.get_cookies(), permissions=0o600)
+        logger.info(f"🍪 Cookies de session sauvegardés : {self.fichier_cookies}")
         
+    @phase_chronometree('connexion_espace_participant')
     def connexion_espace_participant(self):
         """Connexion complète avec email et mot de passe"""
         try:
             logger.info("🔐 Connexion en cours...")
             
             # ÉTAPE 1: Page de connexion initiale
-            self.driver.get("https://le-spot.retail-leaders.fr/fr/login")
-            self.wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
-            time.sleep(2)
+            self.charger_page(self.driver, f"{URL_SITE}/fr/login")
+            self.attentes.attendre('connexion_page', self.driver, AttentesAdaptatives.element_present("#email_email"))
             
             # Saisir l'email
             email_field = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#email_email")))
@@ -87,7 +1811,7 @@ class TonyCompletIntegratedScraper:
             logger.info("✅ Bouton 'Valider' cliqué")
             
             # Attendre la page suivante
-            time.sleep(3)
+            self.attentes.attendre('connexion_valider', self.driver, AttentesAdaptatives.element_present("#login_password"))
             
             # ÉTAPE 2: Saisir le mot de passe
             password_field = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#login_password")))
@@ -101,7 +1825,7 @@ class TonyCompletIntegratedScraper:
             
             # Attendre la connexion
             logger.info("⏳ Connexion en cours...")
-            time.sleep(5)
+            self.attentes.attendre('connexion_se_connecter', self.driver, AttentesAdaptatives.url_ne_contient_plus("login"))
             
             # Vérifier la connexion
             current_url = self.driver.current_url
@@ -115,367 +1839,433 @@ class TonyCompletIntegratedScraper:
         except Exception as e:
             logger.error(f"❌ Erreur lors de la connexion : {str(e)}")
             return False
-    
-    def scraper_profil_base(self, element_profil):
-        """Scrape les informations de base d'un profil avec système de secours"""
-        try:
-            # Fonction helper pour extraire texte avec sélecteurs de secours
-            def extraire_texte_avec_selecteurs(selecteurs, conteneur_parent, nom_champ):
-                for selecteur in selecteurs:
-                    try:
-                        elements = conteneur_parent.find_elements(By.CSS_SELECTOR, selecteur)
-                        if elements and elements[0].text.strip():
-                            return elements[0].text.strip()
-                    except:
-                        continue
-                return f"Non trouvé ({nom_champ})"
-
-            # Entreprise - avec sélecteurs de secours
-            selecteurs_entreprise = [
-                ".catalog-company",
-                ".catalog__title", 
-                ".company-name",
-                "[class*='title']",
-                "[class*='company']"
-            ]
-            entreprise = extraire_texte_avec_selecteurs(selecteurs_entreprise, element_profil, "entreprise")
-
-            # Nom et prénom - avec sélecteurs de secours
-            selecteurs_nom = [
-                ".catalog-name",
-                ".user__infos .name",
-                ".user__name",
-                ".profile-name",
-                "[class*='name']"
-            ]
-            nom_prenom = extraire_texte_avec_selecteurs(selecteurs_nom, element_profil, "nom")
-
-            # Poste - avec sélecteurs de secours
-            selecteurs_poste = [
-                ".catalog-position",
-                ".user__infos .job",
-                ".user__job",
-                ".profile-job",
-                "[class*='job']",
-                "[class*='position']"
-            ]
-            poste = extraire_texte_avec_selecteurs(selecteurs_poste, element_profil, "poste")
-
-            # URL du profil - avec sélecteurs de secours
-            selecteurs_url = [
-                "a.catalog-link",
-                ".catalog-sheet-more",
-                "[href*='profile']",
-                "[href*='user']",
-                "a[href*='sheet']"
-            ]
-
-            url_profil = None
-            for selecteur_url in selecteurs_url:
-                try:
-                    url_element = element_profil.find_element(By.CSS_SELECTOR, selecteur_url)
-                    href = url_element.get_attribute('href')
-                    if href:
-                        if href.startswith('http'):
-                            url_profil = href
-                        else:
-                            url_profil = f"https://le-spot.retail-leaders.fr{href}"
-                        break
-                except:
-                    continue
-
-            if not url_profil:
-                url_profil = "Non disponible"
+    
+    @phase_chronometree('scraper_profil_base')
+    def scraper_profil_base(self, element_profil):
+        """Scrape les informations de base d'une carte du catalogue en un seul appel"""
+        try:
+            carte = self.schema.extraire_navigateur(self.driver, 'catalogue', self.resolveur, racine=element_profil)[0]
+            return {'index': self.nb_profils_complets + 1, **carte}
 
-            # Avatar - avec sélecteurs de secours
-            selecteurs_avatar = [
-                ".catalog-avatar img",
-                ".user-avatar img",
-                "[class*='avatar'] img",
-                "img[src*='avatar']"
-            ]
-            avatar_url = ""
-            for selecteur_avatar in selecteurs_avatar:
-                try:
-                    avatar_elem = element_profil.find_element(By.CSS_SELECTOR, selecteur_avatar)
-                    avatar_url = avatar_elem.get_attribute('src')
-                    if avatar_url:
-                        break
-                except:
-                    continue
+        except Exception as e:
+            logger.error(f"❌ Erreur lors du scraping du profil base : {str(e)}")
+            return None
 
-            return {
-                'index': len(self.profils_complets) + 1,
-                'entreprise': entreprise,
-                'nom_prenom': nom_prenom,
-                'poste': poste,
-                'url_profil': url_profil,
-                'avatar_url': avatar_url
-            }
+    @phase_chronometree('extraire_catalogue_bulk')
+    def extraire_catalogue_bulk(self, debut=0):
+        """Extrait les infos de base de toutes les cartes du catalogue en un seul aller-retour
 
+        Un unique execute_script applique le schéma 'catalogue' à toutes les cartes, avec les
+        mêmes sélecteurs de secours que scraper_profil_base. Retourne une liste de dicts dans
+        l'ordre du catalogue (à partir de la carte `debut`), ou None si l'extraction groupée
+        a échoué.
+        """
+        try:
+            cartes = self.schema.extraire_navigateur(self.driver, 'catalogue', self.resolveur, debut=debut)
         except Exception as e:
-            logger.error(f"❌ Erreur lors du scraping du profil base : {str(e)}")
+            logger.warning(f"⚠️ Extraction groupée du catalogue impossible : {str(e)}")
             return None
+
+        profils = [{'index': None, **carte} for carte in cartes]
+
+        logger.info(f"⚡ {len(profils)} cartes extraites en un seul appel")
+        return profils
     
-    def extraire_elements_cles(self):
-        """Extrait les éléments clés depuis la section dédiée"""
-        elements_cles = {}
+    def resoudre_redirection_linkedin(self, redirect_url, driver=None):
+        """Suit le lien forward/ dans un onglet temporaire et retourne l'URL LinkedIn réelle"""
+        driver = driver or self.driver
+        linkedin_url = redirect_url
+        
+        # Ouvrir un onglet temporaire pour suivre la redirection
+        original_window = self.ouvrir_onglet(driver)
         
         try:
-            # Plusieurs IDs possibles pour la section éléments clés
-            selectors = ["#object-d6fa1ac7", "section h2:contains('Éléments clés')"]
+            # Naviguer vers l'URL de redirection
+            self.charger_page(driver, redirect_url)
+            # Attendre la redirection complète
+            self.attentes.attendre('redirection_linkedin', driver, AttentesAdaptatives.url_contient("linkedin.com"), timeout=10)
             
-            for selector in selectors:
-                try:
-                    section = self.driver.find_element(By.CSS_SELECTOR, f"{selector} .section__content")
-                    items = section.find_elements(By.TAG_NAME, "li")
-                    
-                    for item in items:
-                        text = item.text.strip()
-                        if text.startswith("Effectifs"):
-                            elements_cles['effectifs'] = text.replace("Effectifs : ", "")
-                        elif text.startswith("Chiffre d'affaires"):
-                            elements_cles['chiffre_affaires'] = text.replace("Chiffre d'affaires : ", "")
-                        elif any(keyword in text.lower() for keyword in ['transformation', 'digital', 'retail', 'tech']):
-                            elements_cles['competences'] = text
-                    break
-                except:
-                    continue
-                    
+            # Capturer l'URL finale après redirection
+            final_url = driver.current_url
+            linkedin_url = extraire_url_linkedin(final_url)
+                
         except Exception as e:
-            logger.warning(f"⚠️ Section Éléments clés non trouvée : {str(e)}")
+            logger.warning(f"⚠️ Erreur lors de la redirection : {str(e)}")
+            linkedin_url = redirect_url  # Fallback sur l'URL de redirection
+        finally:
+            # Fermer l'onglet temporaire et revenir au profil
+            driver.close()
+            driver.switch_to.window(original_window)
+        
+        return linkedin_url
+    
+    def resoudre_redirection_http(self, redirect_url):
+        """Suit la chaîne de redirections du lien forward/ en HTTP, saut par saut
+
+        Chaque saut est demandé sans suivi automatique et seule l'en-tête Location (ou un
+        meta refresh) est lue. On s'arrête dès que la cible est sur linkedin.com, sans jamais
+        charger de page LinkedIn. Retourne None si la chaîne nécessite un navigateur.
+        """
+        url = redirect_url
+        for _ in range(MAX_REDIRECTIONS):
+            if est_url_linkedin(url):
+                return extraire_url_linkedin(url)
+            try:
+                reponse = self.requete_http('GET', url, allow_redirects=False, timeout=10)
+            except requests.RequestException as e:
+                logger.warning(f"⚠️ Redirection HTTP impossible ({url}) : {str(e)}")
+                return None
             
-        return elements_cles
+            if reponse.is_redirect and reponse.headers.get('Location'):
+                url = urllib.parse.urljoin(url, reponse.headers['Location'])
+                continue
+            cible = cible_meta_refresh(reponse.text, url) if reponse.status_code == 200 else None
+            if not cible:
+                return None
+            url = cible
+        
+        logger.warning(f"⚠️ Trop de redirections pour {redirect_url}")
+        return None
     
-    def extraire_secteur_activite(self):
-        """Extrait le secteur d'activité"""
-        try:
-            # Recherche flexible de la section secteur
-            secteur_selectors = [
-                "#object-Me3f9M9edd .section__content li.highlight",
-                "h2:contains('SECTEUR') + .section__content li",
-                "*[id*='secteur'] .section__content li"
-            ]
+    @phase_chronometree('resoudre_lien_linkedin')
+    def resoudre_lien_linkedin(self, lien_forward, lien_direct, driver=None):
+        """Retourne l'URL LinkedIn du profil à partir des liens trouvés sur la page"""
+        if lien_forward:
+            logger.info(f"🔗 Détection du bouton LinkedIn : {lien_forward}")
+            if self.cache_redirections:
+                linkedin_url = self.cache_redirections.lire(lien_forward)
+                if linkedin_url:
+                    logger.info(f"✅ URL LinkedIn en cache : {linkedin_url}")
+                    self.metriques.incrementer('redirections_resolues_total', origine='cache')
+                    return linkedin_url
             
-            for selector in secteur_selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    return element.text.strip()
-                except:
-                    continue
-                    
-        except Exception as e:
-            logger.warning(f"⚠️ Secteur d'activité non trouvé : {str(e)}")
-            return None
+            linkedin_url, origine = None, 'http'
+            if self.redirections_http and self.session_http is not None:
+                linkedin_url = self.resoudre_redirection_http(lien_forward)
+            if not linkedin_url:
+                linkedin_url, origine = self.resoudre_redirection_linkedin(lien_forward, driver), 'navigateur'
+            
+            if est_url_linkedin(linkedin_url):
+                self.metriques.incrementer('redirections_resolues_total', origine=origine)
+            if self.cache_redirections and est_url_linkedin(linkedin_url):
+                self.cache_redirections.ecrire(lien_forward, linkedin_url)
+            return linkedin_url
+        if lien_direct:
+            logger.info(f"✅ Lien LinkedIn direct trouvé : {lien_direct}")
+            return lien_direct
+        logger.info("ℹ️ Aucun lien LinkedIn trouvé")
+        return ""
     
-    def extraire_mission(self):
-        """Extrait la mission en une phrase"""
+    @phase_chronometree('scraper_profil_detail')
+    def scraper_profil_detail(self, url_profil=None, driver=None):
+        """Scrape les détails détaillés d'un profil avec récupération de l'URL LinkedIn réelle"""
+        driver = driver or self.driver
+        details = {}
         try:
-            mission_selectors = [
-                "#object-M4561Macb7 .section__content li",
-                "h2:contains('Ma mission') + .section__content li",
-                "*[id*='mission'] .section__content li"
-            ]
+            # Attendre que le document soit chargé et ses sections présentes, sans délai fixe
+            self.attentes.attendre('page_profil', driver, AttentesAdaptatives.contenu_pret('.section__content'))
+            
+            html = driver.page_source if self.extraction_hors_ligne or self.archive else None
+            self.archiver_page(url_profil, 'detail', html, 'navigateur')
+            if self.extraction_hors_ligne:
+                # Un seul aller-retour : le HTML est analysé localement
+                champs = parser_profil_detail_html(html, url_profil, self.resolveur, self.schema)
+            else:
+                # Un seul aller-retour : le schéma est appliqué dans la page
+                champs = self.schema.extraire_navigateur(driver, 'detail', self.resolveur, url_page=url_profil)[0]
+            lien_forward = champs.pop('lien_forward', None)
+            lien_direct = champs.pop('lien_linkedin_direct', None)
+            if not any(champs.values()) and not lien_forward and not lien_direct:
+                raise ProfilIncomplet(f"aucun champ trouvé sur {url_profil}")
+            details = {**champs, 'scraped_at': datetime.now().isoformat()}
+            
+            # Scraper l'URL LinkedIn avec gestion de redirection
+            details['linkedin_url'] = self.resoudre_lien_linkedin(lien_forward, lien_direct, driver)
+            
+            logger.info("✅ Informations détaillées extraites")
+            return details
             
-            for selector in mission_selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    return element.text.strip()
-                except:
-                    continue
-                    
         except Exception as e:
-            logger.warning(f"⚠️ Mission non trouvée : {str(e)}")
-            return None
+            if PolitiqueReessai.est_reessayable(e) or isinstance(e, BudgetProfilEpuise):
+                raise
+            logger.error(f"❌ Erreur lors du scraping détaillé : {str(e)}")
+            return {}
     
-    def extraire_nombre_points_vente(self):
-        """Extrait le nombre de points de vente"""
+    def scraper_profil_detail_navigateur(self, url_profil, driver=None):
+        """Ouvre le profil dans un nouvel onglet, en scrape les détails puis revient au catalogue"""
+        driver = driver or self.driver
+        original_window = self.ouvrir_onglet(driver)
         try:
-            points_selectors = [
-                "#object-M91ceM1169 .section__content li.highlight",
-                "h2:contains('points de vente') + .section__content li",
-                "*[id*='vente'] .section__content li"
-            ]
-            
-            for selector in points_selectors:
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    return element.text.strip()
-                except:
-                    continue
-                    
-        except Exception as e:
-            logger.warning(f"⚠️ Nombre de points de vente non trouvé : {str(e)}")
+            # Aller sur la page du profil
+            self.charger_page(driver, url_profil)
+            return self.scraper_profil_detail(url_profil, driver)
+        finally:
+            # Fermer l'onglet et revenir au catalogue
+            driver.close()
+            driver.switch_to.window(original_window)
+    
+    def exporter_session_http(self):
+        """Copie les cookies du navigateur connecté dans une session requests avec pool de connexions"""
+        session = requests.Session()
+        adaptateur = HTTPAdapter(pool_connections=4, pool_maxsize=max(TAILLE_POOL_HTTP, self.concurrence))
+        session.mount("https://", adaptateur)
+        session.mount("http://", adaptateur)
+        
+        try:
+            user_agent = self.driver.execute_script("return navigator.userAgent")
+            session.headers['User-Agent'] = user_agent
+        except Exception:
+            pass
+        session.headers['Accept-Language'] = "fr-FR,fr;q=0.9"
+        
+        for cookie in self.driver.get_cookies():
+            session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/')
+            )
+        
+        self.session_http = session
+        logger.info(f"🍪 Session HTTP initialisée avec {len(session.cookies)} cookies du navigateur")
+        return session
+    
+    def telecharger_page_http(self, url):
+        """Télécharge une page en HTTP direct, retourne None si le navigateur est nécessaire"""
+        if self.session_http is None:
+            return None
+        try:
+            reponse = self.requete_http('GET', url, timeout=15)
+        except requests.RequestException as e:
+            logger.warning(f"⚠️ Téléchargement HTTP impossible ({url}) : {str(e)}")
+            return None
+        
+        if reponse.status_code != 200 or "login" in reponse.url.lower():
+            logger.warning(f"⚠️ Réponse HTTP inexploitable ({reponse.status_code}) pour {url}")
+            return None
+        if page_necessite_javascript(reponse.text):
+            logger.info(f"ℹ️ Page rendue côté client, passage par le navigateur : {url}")
+            return None
+        return reponse.text
+    
+    @phase_chronometree('scraper_profil_detail_http')
+    def scraper_profil_detail_http(self, url_profil, driver=None):
+        """Scrape les détails d'un profil sans ouvrir d'onglet, retourne None si le navigateur est nécessaire"""
+        html = self.telecharger_page_http(url_profil)
+        if html is None:
             return None
+        self.archiver_page(url_profil, 'detail', html, 'http')
+        
+        champs = parser_profil_detail_html(html, url_profil, self.resolveur, self.schema)
+        lien_forward = champs.pop('lien_forward', None)
+        lien_direct = champs.pop('lien_linkedin_direct', None)
+        details = {**champs, 'scraped_at': datetime.now().isoformat()}
+        details['linkedin_url'] = self.resoudre_lien_linkedin(lien_forward, lien_direct, driver)
+        
+        logger.info("✅ Informations détaillées extraites (HTTP)")
+        return details
     
-    def extraire_solutions_competences(self):
-        """Extrait les solutions/compétences recherchées"""
+    def enrichir_profil(self, profil_base, driver=None):
+        """Ajoute les détails au profil de base, en HTTP direct si possible
+
+        Les erreurs passagères sont retentées avec attente exponentielle, le tout dans le
+        budget de temps du profil ; l'erreur finale est propagée à l'appelant.
+        """
+        def tentative():
+            details = None
+            if self.mode_http:
+                details = self.scraper_profil_detail_http(profil_base['url_profil'], driver)
+            if details is None:
+                details = self.scraper_profil_detail_navigateur(profil_base['url_profil'], driver)
+            return {**profil_base, **details}
+        
+        debut = time.monotonic()
         try:
-            solutions_selectors = [
-                "#object-M184bM50c8 .section__content li.highlight",
-                "h2:contains('Solutions') + .section__content li",
-                "*[id*='solution'] .section__content li"
-            ]
+            with self.phases.span('profil', url_profil=profil_base['url_profil']), \
+                    self.attentes.echeance(self.politique_reessai.budget_profil):
+                return self.politique_reessai.executer(tentative, f"Profil {profil_base['url_profil']}", self.attentes)
+        finally:
+            self.metriques.observer('latence_profil_secondes', time.monotonic() - debut)
+    
+    @contextmanager
+    def pool_workers(self):
+        """Ouvre le pool de workers et fournit (executeur, traiter) pour soumettre des profils
+
+        Chaque worker emprunte un navigateur connecté (cookies copiés depuis le navigateur
+        principal) dans une file partagée ; en mode HTTP le navigateur ne sert que de secours
+        et n'est lancé qu'au premier besoin.
+        """
+        pool_drivers = queue.Queue()
+        drivers = []
+        try:
+            for _ in range(self.concurrence):
+                if self.mode_http:
+                    driver = NavigateurALaDemande(self.creer_driver_connecte)
+                else:
+                    driver = self.creer_driver_connecte()
+                drivers.append(driver)
+                pool_drivers.put(driver)
             
-            for selector in solutions_selectors:
+            def traiter(profil_numero, profil_base):
+                driver = pool_drivers.get()
                 try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    return element.text.strip()
-                except:
-                    continue
-                    
-        except Exception as e:
-            logger.warning(f"⚠️ Solutions non trouvées : {str(e)}")
-            return None
+                    logger.info(f"📋 Profil {profil_numero}: {profil_base['nom_prenom']} - {profil_base['entreprise']}")
+                    return self.enrichir_profil(profil_base, driver)
+                finally:
+                    pool_drivers.put(driver)
+            
+            with ThreadPoolExecutor(max_workers=self.concurrence) as executeur:
+                yield executeur, traiter
+        finally:
+            for driver in drivers:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
     
-    def scraper_profil_detail(self):
-        """Scrape les détails détaillés d'un profil avec récupération de l'URL LinkedIn réelle"""
-        details = {}
+    def fusionner_resultat(self, profil_numero, profil_base, future):
+        """Enregistre le résultat d'un worker (appelé dans l'ordre du catalogue)"""
         try:
-            # Attendre que la page soit chargée
-            self.wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
-            time.sleep(2)
-            
-            # Extraire toutes les informations détaillées
-            details = {
-                'elements_cles': self.extraire_elements_cles(),
-                'secteur_activite': self.extraire_secteur_activite(),
-                'mission': self.extraire_mission(),
-                'nombre_points_vente': self.extraire_nombre_points_vente(),
-                'solutions_competences': self.extraire_solutions_competences(),
-                'scraped_at': datetime.now().isoformat()
-            }
-            
-            # Scraper l'URL LinkedIn avec gestion de redirection
-            linkedin_url = ""
-            try:
-                # Recherche prioritaire du bouton de redirection LinkedIn
-                linkedin_button = self.driver.find_element(By.CSS_SELECTOR, "a[href*='forward/'][target='_blank']")
-                redirect_url = linkedin_button.get_attribute('href')
+            profil_complet = future.result()
+            profil_complet['index'] = self.nb_profils_complets + 1
+            self.ajouter_profil_complet(profil_complet, profil_numero)
+            logger.info(f"✅ Profil {profil_numero} complet enrichi")
+        except Exception as e:
+            logger.error(f"❌ Erreur lors du traitement du profil {profil_numero}: {str(e)}")
+            self.noter_echec_profil(profil_numero, profil_base)
+    
+    def scraper_profils_concurrents(self, profils_base):
+        """Scrape les détails avec un pool de workers et fusionne dans l'ordre du catalogue"""
+        logger.info(f"⚡ Scraping concurrent de {len(profils_base)} profils avec {self.concurrence} workers")
+        
+        with self.pool_workers() as (executeur, traiter):
+            futures = [
+                (profil_numero, profil_base, executeur.submit(traiter, profil_numero, profil_base))
+                for profil_numero, profil_base in profils_base
+            ]
+            # Fusion dans l'ordre du catalogue
+            for profil_numero, profil_base, future in futures:
+                self.fusionner_resultat(profil_numero, profil_base, future)
+    
+    def scraper_profils_pipeline(self, cartes, nb_profils, position_depart):
+        """Envoie chaque carte aux workers dès qu'elle apparaît, pendant que le catalogue se charge
+
+        `cartes` est un itérable produit au fil du chargement (clics 'Voir plus' ou pages XHR).
+        Les résultats prêts sont fusionnés dans l'ordre du catalogue sans attendre la fin du
+        chargement, et le chargement s'arrête dès que la plage demandée est couverte.
+        """
+        index_debut = position_depart - 1
+        index_fin = None if nb_profils == 0 else index_debut + nb_profils
+        en_attente = deque()
+        
+        logger.info(f"⚡ Pipeline démarré avec {self.concurrence} workers")
+        with self.pool_workers() as (executeur, traiter):
+            for index, profil_base in enumerate(cartes):
+                if index < index_debut:
+                    continue
+                if index_fin is not None and index >= index_fin:
+                    break
+                if self.profil_a_ignorer(index + 1, profil_base):
+                    continue
+                en_attente.append((index + 1, profil_base, executeur.submit(traiter, index + 1, profil_base)))
                 
-                if redirect_url:
-                    logger.info(f"🔗 Détection du bouton LinkedIn : {redirect_url}")
-                    
-                    # Ouvrir un onglet temporaire pour suivre la redirection
-                    original_window = self.driver.current_window_handle
-                    self.driver.execute_script("window.open('');")
-                    self.driver.switch_to.window(self.driver.window_handles[-1])
-                    
-                    try:
-                        # Naviguer vers l'URL de redirection
-                        self.driver.get(redirect_url)
-                        time.sleep(3)  # Attendre la redirection complète
-                        
-                        # Capturer l'URL finale après redirection
-                        final_url = self.driver.current_url
-                        
-                        # Extraire l'URL LinkedIn réelle même depuis les pages d'authentification
-                        linkedin_url = final_url
-                        
-                        # Si c'est une URL d'authentification LinkedIn, extraire l'URL de redirection
-                        if "linkedin.com/authwall" in final_url or "sessionRedirect" in final_url:
-                            # Extraire l'URL de redirection depuis les paramètres
-                            if "sessionRedirect=" in final_url:
-                                import urllib.parse
-                                redirect_param = final_url.split("sessionRedirect=")[1]
-                                if "%3F" in redirect_param:
-                                    redirect_param = redirect_param.split("%3F")[0]
-                                linkedin_url = urllib.parse.unquote(redirect_param)
-                                logger.info(f"✅ URL LinkedIn extraite depuis authwall : {linkedin_url}")
-                            else:
-                                logger.info(f"✅ URL LinkedIn détectée : {final_url}")
-                        elif "linkedin.com/in/" in final_url:
-                            # URL LinkedIn directe - nettoyer les paramètres
-                            base_url = final_url.split("?")[0]
-                            linkedin_url = base_url
-                            logger.info(f"✅ URL LinkedIn finale obtenue : {linkedin_url}")
-                        else:
-                            logger.warning(f"⚠️ URL non-LinkedIn détectée : {final_url}")
-                            linkedin_url = final_url
-                            
-                    except Exception as e:
-                        logger.warning(f"⚠️ Erreur lors de la redirection : {str(e)}")
-                        linkedin_url = redirect_url  # Fallback sur l'URL de redirection
-                    finally:
-                        # Fermer l'onglet temporaire et revenir au profil
-                        self.driver.close()
-                        self.driver.switch_to.window(original_window)
-                        
-            except:
-                # Fallback : recherche d'un lien LinkedIn direct
-                try:
-                    linkedin_element = self.driver.find_element(By.CSS_SELECTOR, "a[href*='linkedin.com/in/']")
-                    linkedin_url = linkedin_element.get_attribute('href')
-                    logger.info(f"✅ Lien LinkedIn direct trouvé : {linkedin_url}")
-                except:
-                    linkedin_url = ""
-                    logger.info("ℹ️ Aucun lien LinkedIn trouvé")
+                # Fusionner au fil de l'eau les résultats déjà prêts
+                while en_attente and en_attente[0][2].done():
+                    self.fusionner_resultat(*en_attente.popleft())
             
-            details['linkedin_url'] = linkedin_url
+            while en_attente:
+                self.fusionner_resultat(*en_attente.popleft())
+    
+    def cliquer_voir_plus(self, bouton_voir_plus):
+        """Clique sur 'Voir plus' : la requête XHR déclenchée compte dans le budget du site"""
+        with self.limiteur.requete(self.catalogue_url):
+            self.driver.execute_script("arguments[0].click();", bouton_voir_plus)
+    
+    def generer_cartes_voir_plus(self):
+        """Produit les cartes du catalogue au fur et à mesure des clics sur 'Voir plus'"""
+        deja_produites = 0
+        while True:
+            cartes = self.extraire_catalogue_bulk(debut=deja_produites) or []
+            if self.cartes_toutes_connues(cartes):
+                logger.info(f"✅ Page déjà connue atteinte - arrêt du chargement à {deja_produites} profils")
+                return
+            for carte in cartes:
+                yield carte
+            deja_produites += len(cartes)
             
-            logger.info("✅ Informations détaillées extraites")
-            return details
+            bouton_voir_plus = self.attentes.attendre(
+                'bouton_voir_plus', self.driver,
+                EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn.btn-primary.see-more")),
+                timeout=5
+            )
+            if not bouton_voir_plus:
+                logger.info(f"✅ Plus de bouton 'Voir plus' - {deja_produites} profils au total")
+                return
             
-        except Exception as e:
-            logger.error(f"❌ Erreur lors du scraping détaillé : {str(e)}")
-            return {}
+            self.cliquer_voir_plus(bouton_voir_plus)
+            if not self.attentes.attendre(
+                'voir_plus', self.driver,
+                AttentesAdaptatives.nombre_elements_change(SELECTEURS_PROFILS[0], deja_produites),
+                timeout=10
+            ):
+                logger.info(f"✅ Tous les profils ont été chargés - {deja_produites} profils au total")
+                return
     
+    @phase_chronometree('charger_tous_les_profils')
     def charger_tous_les_profils(self):
         """Clique sur 'Voir plus' jusqu'à charger tous les profils"""
         try:
             logger.info("🔄 Chargement de tous les profils...")
             
-            profils_initiaux = 0
             profils_totaux = 0
+            profils_verifies = 0
             pages_chargees = 0
             
             while True:
                 # Compter les profils actuellement visibles
-                selecteurs_profils = [
-                    ".catalog__item",
-                    ".catalog-item",
-                    "[class*='catalog'] [class*='item']",
-                    ".card-profile",
-                    ".catalog-card",
-                    "[class*='profile-card']"
-                ]
-                
                 profils_actuels = 0
-                for selecteur in selecteurs_profils:
+                selecteur_actif = SELECTEURS_PROFILS[0]
+                for selecteur in self.resolveur.ordonner('profils', SELECTEURS_PROFILS):
                     profils_actuels = len(self.driver.find_elements(By.CSS_SELECTOR, selecteur))
                     if profils_actuels > 0:
+                        selecteur_actif = selecteur
                         break
                 
                 profils_totaux = profils_actuels
                 
-                # Vérifier si le bouton "Voir plus" existe et est cliquable
-                try:
-                    bouton_voir_plus = self.wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn.btn-primary.see-more"))
-                    )
-                    
-                    # Scroller jusqu'au bouton
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", bouton_voir_plus)
-                    time.sleep(1)
-                    
-                    # Cliquer sur le bouton
-                    self.driver.execute_script("arguments[0].click();", bouton_voir_plus)
-                    pages_chargees += 1
-                    
-                    # Attendre que de nouveaux profils se chargent
-                    logger.info(f"📄 Page {pages_chargees} chargée - {profils_totaux} profils actuellement")
-                    time.sleep(3)
-                    
-                    # Vérifier si de nouveaux profils ont été ajoutés
-                    if profils_actuels == profils_initiaux:
-                        logger.info("✅ Tous les profils ont été chargés")
+                # Mode incrémental : arrêter dès qu'une page ne contient que des profils connus
+                if self.incremental:
+                    if self.cartes_toutes_connues(self.extraire_catalogue_bulk(debut=profils_verifies)):
+                        logger.info(f"✅ Page déjà connue atteinte - arrêt du chargement à {profils_totaux} profils")
                         break
-                    
-                    profils_initiaux = profils_actuels
-                    
-                except:
+                    profils_verifies = profils_actuels
+                
+                # Vérifier si le bouton "Voir plus" existe et est cliquable
+                bouton_voir_plus = self.attentes.attendre(
+                    'bouton_voir_plus', self.driver,
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn.btn-primary.see-more")),
+                    timeout=5
+                )
+                if not bouton_voir_plus:
                     logger.info(f"✅ Plus de bouton 'Voir plus' - {profils_totaux} profils au total")
                     break
+                
+                # Cliquer sur le bouton
+                self.cliquer_voir_plus(bouton_voir_plus)
+                pages_chargees += 1
+                
+                # Attendre que de nouveaux profils se chargent
+                nouveau_total = self.attentes.attendre(
+                    'voir_plus', self.driver,
+                    AttentesAdaptatives.nombre_elements_change(selecteur_actif, profils_actuels),
+                    timeout=10
+                )
+                logger.info(f"📄 Page {pages_chargees} chargée - {nouveau_total or profils_totaux} profils actuellement")
+                
+                # Vérifier si de nouveaux profils ont été ajoutés
+                if not nouveau_total:
+                    logger.info("✅ Tous les profils ont été chargés")
+                    break
             
             logger.info(f"🎯 {profils_totaux} profils trouvés au total après {pages_chargees} clics sur 'Voir plus'")
             return profils_totaux
@@ -486,8 +2276,148 @@ class TonyCompletIntegratedScraper:
 
     
 
+    @phase_chronometree('decouvrir_requete_voir_plus')
+    def decouvrir_requete_voir_plus(self):
+        """Clique une fois sur 'Voir plus' et retrouve la requête XHR émise dans le journal réseau
+
+        Retourne un dict décrivant la requête (url, méthode, corps, en-têtes, paramètre de
+        pagination et pas entre deux pages), ou None si aucune requête exploitable n'a été vue.
+        """
+        bouton_voir_plus = self.attentes.attendre(
+            'bouton_voir_plus', self.driver,
+            EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn.btn-primary.see-more")),
+            timeout=5
+        )
+        if not bouton_voir_plus:
+            return None
+        
+        # Vider le journal avant le clic pour ne garder que les requêtes qu'il déclenche
+        self.driver.get_log('performance')
+        profils_avant = self.driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length", SELECTEURS_PROFILS[0]
+        )
+        self.cliquer_voir_plus(bouton_voir_plus)
+        profils_apres = self.attentes.attendre(
+            'voir_plus', self.driver,
+            AttentesAdaptatives.nombre_elements_change(SELECTEURS_PROFILS[0], profils_avant),
+            timeout=10
+        )
+        
+        requete = None
+        for entree in self.driver.get_log('performance'):
+            message = json.loads(entree['message'])['message']
+            if message.get('method') != 'Network.requestWillBeSent':
+                continue
+            params = message['params']
+            if params.get('type') not in ('XHR', 'Fetch'):
+                continue
+            if urllib.parse.urlsplit(params['request']['url']).netloc != urllib.parse.urlsplit(URL_SITE).netloc:
+                continue
+            requete = params['request']
+        
+        if not requete:
+            logger.warning("⚠️ Aucune requête XHR détectée après 'Voir plus'")
+            return None
+        
+        pagination = analyser_pagination(requete['url'], requete.get('postData'))
+        if not pagination:
+            logger.warning(f"⚠️ Paramètre de pagination introuvable dans {requete['url']}")
+            return None
+        
+        emplacement, nom, valeur = pagination
+        pas = 1
+        if nom.lower() in PARAMETRES_DECALAGE and profils_apres:
+            pas = profils_apres - profils_avant
+        
+        en_tetes = {
+            cle: valeur_en_tete for cle, valeur_en_tete in requete.get('headers', {}).items()
+            if cle.lower() not in ('cookie', 'host', 'content-length')
+        }
+        en_tetes.setdefault('X-Requested-With', 'XMLHttpRequest')
+        
+        logger.info(f"🔎 Requête 'Voir plus' détectée : {requete['method']} {requete['url']} ({nom}={valeur}, pas {pas})")
+        return {
+            'url': requete['url'],
+            'methode': requete['method'],
+            'corps': requete.get('postData'),
+            'en_tetes': en_tetes,
+            'emplacement': emplacement,
+            'parametre': nom,
+            'valeur': valeur,
+            'pas': pas,
+        }
+    
+    def paginer_catalogue_xhr(self, requete, urls_connues=None):
+        """Parcourt directement les pages suivantes du catalogue en HTTP et produit les cartes au fil de l'eau"""
+        urls_connues = set(urls_connues or ())
+        valeur = requete['valeur']
+        pages = 0
+        
+        while True:
+            valeur += requete['pas']
+            url, corps = remplacer_parametre(
+                requete['url'], requete['corps'], requete['emplacement'], requete['parametre'], valeur
+            )
+            with self.phases.span('page_catalogue_xhr', page=valeur) as span:
+                try:
+                    reponse = self.requete_http(
+                        requete['methode'], url, data=corps, headers=requete['en_tetes'], timeout=15
+                    )
+                    reponse.raise_for_status()
+                except requests.RequestException as e:
+                    span['statut'] = 'echec'
+                    logger.warning(f"⚠️ Page XHR {valeur} inaccessible : {str(e)}")
+                    return
+                
+                cartes = []
+                for fragment in fragments_html_reponse(reponse):
+                    self.archiver_page(url, 'catalogue', fragment, 'http', ordre=valeur)
+                    cartes.extend(extraire_cartes_html(fragment, url, self.resolveur, self.schema))
+                span['cartes'] = len(cartes)
+            
+            nouvelles = [carte for carte in cartes if carte['url_profil'] not in urls_connues]
+            if not nouvelles:
+                logger.info(f"✅ Fin du catalogue atteinte après {pages} pages XHR")
+                return
+            if self.cartes_toutes_connues(nouvelles):
+                logger.info(f"✅ Page déjà connue atteinte après {pages} pages XHR")
+                return
+            
+            pages += 1
+            logger.info(f"📄 Page XHR {pages} : {len(nouvelles)} profils")
+            for carte in nouvelles:
+                urls_connues.add(carte['url_profil'])
+                yield carte
+    
+    def charger_catalogue_xhr(self):
+        """Produit toutes les cartes du catalogue : celles déjà affichées, puis les pages XHR
+
+        Retourne None (au lieu d'un générateur) si la requête 'Voir plus' n'a pas pu être
+        identifiée, auquel cas il faut revenir à charger_tous_les_profils().
+        """
+        requete = self.decouvrir_requete_voir_plus()
+        if not requete or self.session_http is None:
+            return None
+        
+        cartes_affichees = self.extraire_catalogue_bulk() or []
+        # Page affichée archivée avant les fragments XHR, qui la suivent dans le catalogue
+        if self.archive:
+            self.archiver_page(self.catalogue_url, 'catalogue', self.driver.page_source, 'navigateur', ordre=0)
+        
+        def generer():
+            for carte in cartes_affichees:
+                yield carte
+            if self.cartes_toutes_connues(cartes_affichees):
+                return
+            yield from self.paginer_catalogue_xhr(requete, [carte['url_profil'] for carte in cartes_affichees])
+        
+        return generer()
+    
     def demander_parametres_scraping(self):
-        """Demande interactivement les paramètres de scraping"""
+        """Demande interactivement les paramètres de scraping, sauf s'ils ont été fournis"""
+        if self.nombre_profils is not None:
+            logger.info(f"✅ Configuration : {self.nombre_profils} profils à partir du n°{self.position_depart}")
+            return self.nombre_profils, self.position_depart
         try:
             print("\n" + "="*50)
             print("📊 CONFIGURATION DU SCRAPING")
@@ -530,8 +2460,7 @@ class TonyCompletIntegratedScraper:
             logger.info("🔍 Recherche des profils dans le catalogue...")
             
             # Attendre que la page soit chargée
-            self.wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
-            time.sleep(3)
+            self.attentes.attendre('catalogue_page', self.driver, AttentesAdaptatives.reseau_inactif())
             
             # Trier par "Derniers inscrits" - ATTENDRE et cliquer sur le bouton radio
             logger.info("📅 Tri par 'Derniers inscrits'...")
@@ -543,14 +2472,11 @@ class TonyCompletIntegratedScraper:
                 
                 # Vérifier si ce n'est pas déjà sélectionné
                 if not radio_derniers.is_selected():
-                    # Scroller jusqu'à l'élément avec une marge pour éviter les headers fixes
-                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", radio_derniers)
-                    time.sleep(2)
-                    
                     # Cliquer via JavaScript pour éviter les problèmes d'interception
                     self.driver.execute_script("arguments[0].click();", radio_derniers)
                     logger.info("✅ Tri par 'Derniers inscrits' activé")
-                    time.sleep(3)  # Attendre le rechargement complet
+                    # Attendre le rechargement complet
+                    self.attentes.attendre('catalogue_tri', self.driver, AttentesAdaptatives.reseau_inactif())
                 else:
                     logger.info("ℹ️ Tri 'Derniers inscrits' déjà activé")
                     
@@ -559,33 +2485,60 @@ class TonyCompletIntegratedScraper:
             except Exception as e:
                 logger.warning(f"⚠️ Erreur lors du tri : {str(e)}, continuation...")
             
-            # Charger tous les profils en cliquant sur "Voir plus"
-            total_profils = self.charger_tous_les_profils()
+            # Mode pipeline : le scraping détaillé démarre pendant le chargement du catalogue
+            if self.pipeline:
+                nb_profils, position_depart = self.demander_parametres_scraping()
+                if nb_profils is None or position_depart is None:
+                    return False
+                cartes = self.charger_catalogue_xhr() if self.pagination_directe else None
+                if cartes is None:
+                    cartes = self.generer_cartes_voir_plus()
+                self.scraper_profils_pipeline(cartes, nb_profils, position_depart)
+                if self.archive:
+                    self.archiver_page(self.catalogue_url, 'catalogue', self.driver.page_source, 'navigateur', ordre=0)
+                logger.info(f"✅ Scraping du catalogue terminé : {self.nb_profils_complets} profils extraits")
+                return True
+            
+            # Charger tous les profils, directement via la requête XHR de "Voir plus" si possible
+            profils_catalogue = None
+            if self.pagination_directe:
+                cartes = self.charger_catalogue_xhr()
+                if cartes is not None:
+                    profils_catalogue = list(cartes)
+                    total_profils = len(profils_catalogue)
+                else:
+                    logger.warning("⚠️ Pagination directe indisponible, retour aux clics sur 'Voir plus'")
+            
+            # Sinon charger tous les profils en cliquant sur "Voir plus"
+            if profils_catalogue is None:
+                total_profils = self.charger_tous_les_profils()
             if total_profils == 0:
                 logger.error("❌ Aucun profil trouvé")
                 return False
                 
+            # Catalogue chargé : il est archivé tel qu'affiché
+            if self.archive:
+                self.archiver_page(self.catalogue_url, 'catalogue', self.driver.page_source, 'navigateur', ordre=0)
+            
             # Demander les paramètres de scraping
             nb_profils, position_depart = self.demander_parametres_scraping()
             if nb_profils is None or position_depart is None:
                 return False
             
+            # Extraction groupée des cartes en un seul aller-retour
+            if profils_catalogue is None and self.extraction_groupee:
+                profils_catalogue = self.extraire_catalogue_bulk()
+            
             # Localiser les conteneurs de profils après chargement complet
             profil_conteneurs = []
-            selecteurs_profils = [
-                ".catalog__item",
-                ".catalog-item",
-                "[class*='catalog'] [class*='item']",
-                ".card-profile",
-                ".catalog-card",
-                "[class*='profile-card']"
-            ]
-            
-            for selecteur in selecteurs_profils:
-                profil_conteneurs = self.driver.find_elements(By.CSS_SELECTOR, selecteur)
-                if profil_conteneurs:
-                    logger.info(f"✅ {len(profil_conteneurs)} profils trouvés avec le sélecteur: {selecteur}")
-                    break
+            if profils_catalogue:
+                profil_conteneurs = profils_catalogue
+            else:
+                for selecteur in self.resolveur.ordonner('profils', SELECTEURS_PROFILS):
+                    profil_conteneurs = self.driver.find_elements(By.CSS_SELECTOR, selecteur)
+                    if profil_conteneurs:
+                        logger.info(f"✅ {len(profil_conteneurs)} profils trouvés avec le sélecteur: {selecteur}")
+                        break
             
             if len(profil_conteneurs) == 0:
                 logger.error("❌ Aucun profil trouvé avec aucun sélecteur")
@@ -614,57 +2567,59 @@ class TonyCompletIntegratedScraper:
                 logger.error(f"❌ Position de départ {position_depart} supérieure au nombre de profils ({total_profils})")
                 return False
             
+            if self.concurrence > 1:
+                profils_base = []
+                for index in range(index_debut, index_fin):
+                    if profils_catalogue:
+                        profil_base = dict(profils_catalogue[index])
+                    else:
+                        profil_conteneurs = self.driver.find_elements(By.CSS_SELECTOR, SELECTEURS_PROFILS[0])
+                        profil_base = self.scraper_profil_base(profil_conteneurs[index])
+                    if self.profil_a_ignorer(index + 1, profil_base):
+                        continue
+                    profils_base.append((index + 1, profil_base))
+                
+                self.scraper_profils_concurrents(profils_base)
+                logger.info(f"✅ Scraping du catalogue terminé : {self.nb_profils_complets} profils extraits")
+                return True
+            
             # Boucle de scraping
             for index in range(index_debut, index_fin):
+                profil_base = None
                 try:
-                    # Re-trouver les éléments (DOM peut avoir changé)
-                    profil_conteneurs = self.driver.find_elements(By.CSS_SELECTOR, selecteurs_profils[0])
-                    profil_element = profil_conteneurs[index]
-                    
                     profil_numero = index + 1  # Numéro de profil pour l'affichage
                     
                     # Scraper les infos de base
-                    profil_base = self.scraper_profil_base(profil_element)
-                    if not profil_base or not profil_base.get('url_profil'):
-                        logger.warning(f"⚠️ Profil {profil_numero} ignoré (pas d'URL)")
+                    if profils_catalogue:
+                        profil_base = dict(profils_catalogue[index], index=self.nb_profils_complets + 1)
+                    else:
+                        # Re-trouver les éléments (DOM peut avoir changé)
+                        profil_conteneurs = self.driver.find_elements(By.CSS_SELECTOR, SELECTEURS_PROFILS[0])
+                        profil_element = profil_conteneurs[index]
+                        profil_base = self.scraper_profil_base(profil_element)
+                    if self.profil_a_ignorer(profil_numero, profil_base):
                         continue
                     
                     total_a_traiter = index_fin - index_debut
                     logger.info(f"\n📋 Profil {profil_numero}/{index_fin}: {profil_base['nom_prenom']} - {profil_base['entreprise']}")
                     
-                    # Ouvrir le profil dans un nouvel onglet
-                    original_window = self.driver.current_window_handle
-                    self.driver.execute_script("window.open('');")
-                    self.driver.switch_to.window(self.driver.window_handles[1])
-                    
-                    # Aller sur la page du profil
-                    self.driver.get(profil_base['url_profil'])
-                    
-                    # Scraper les détails
-                    details = self.scraper_profil_detail()
-                    
-                    # Combiner les informations
-                    profil_complet = {**profil_base, **details}
-                    self.profils_complets.append(profil_complet)
-                    
-                    # Fermer l'onglet et revenir au catalogue
-                    self.driver.close()
-                    self.driver.switch_to.window(original_window)
+                    # Scraper les détails et combiner les informations
+                    profil_complet = self.enrichir_profil(profil_base)
+                    self.ajouter_profil_complet(profil_complet, profil_numero)
                     
                     logger.info("✅ Profil complet enrichi")
                     
-                    # Pause entre les profils
-                    time.sleep(1)
-                    
                 except Exception as e:
                     logger.error(f"❌ Erreur lors du traitement du profil {index+1}: {str(e)}")
+                    if profil_base:
+                        self.noter_echec_profil(index + 1, profil_base)
                     # Revenir au catalogue en cas d'erreur
                     if len(self.driver.window_handles) > 1:
                         self.driver.close()
                         self.driver.switch_to.window(self.driver.window_handles[0])
                     continue
             
-            logger.info(f"✅ Scraping du catalogue terminé : {len(self.profils_complets)} profils extraits")
+            logger.info(f"✅ Scraping du catalogue terminé : {self.nb_profils_complets} profils extraits")
             return True
                     
         except Exception as e:
@@ -673,20 +2628,19 @@ class TonyCompletIntegratedScraper:
             self.driver.save_screenshot(f"debug_erreur_{int(time.time())}.png")
             return False
     
+    @phase_chronometree('navigation_catalogue')
     def navigation_catalogue(self):
         """Navigue vers le catalogue après connexion"""
         try:
             logger.info("🚀 Navigation vers le Catalogue...")
             
-            # Attendre que la navigation soit chargée
-            self.wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
-            time.sleep(2)
-            
-            # Rechercher et cliquer sur l'icône Catalogue
-            catalogue_icon = self.wait.until(EC.element_to_be_clickable((
+            # Attendre que la navigation soit chargée et rechercher l'icône Catalogue
+            catalogue_icon = self.attentes.attendre('navigation_menu', self.driver, EC.element_to_be_clickable((
                 By.CSS_SELECTOR, 
                 "span.nav-item-icon.icon-Catalogue"
             )))
+            if not catalogue_icon:
+                raise TimeoutException("Icône Catalogue introuvable")
             
             # Trouver l'élément clickable parent
             catalogue_link = catalogue_icon.find_element(
@@ -694,13 +2648,11 @@ class TonyCompletIntegratedScraper:
                 ".//ancestor::a[1] | .//ancestor::button[1] | .//parent::div"
             )
             
-            # Scroller et cliquer
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", catalogue_link)
-            time.sleep(1)
+            # Cliquer (Selenium fait défiler jusqu'à l'élément)
             catalogue_link.click()
             
             # Attendre la navigation
-            time.sleep(3)
+            self.attentes.attendre('navigation_catalogue', self.driver, AttentesAdaptatives.url_contient("catalog"), timeout=10)
             
             # Vérifier la navigation
             current_url = self.driver.current_url
@@ -712,8 +2664,8 @@ class TonyCompletIntegratedScraper:
             else:
                 logger.warning(f"⚠️ URL actuelle: {current_url}")
                 # Essayer d'accéder directement à l'URL du catalogue
-                self.driver.get(self.catalogue_url)
-                time.sleep(3)
+                self.charger_page(self.driver, self.catalogue_url)
+                self.attentes.attendre('navigation_catalogue_directe', self.driver, AttentesAdaptatives.document_pret)
                 return True
                 
         except Exception as e:
@@ -722,84 +2674,655 @@ class TonyCompletIntegratedScraper:
             self.driver.save_screenshot(f"debug_navigation_{int(time.time())}.png")
             return False
 
+    @phase_chronometree('reprendre_profils_en_echec')
+    def reprendre_profils_en_echec(self):
+        """Retente une dernière fois, en fin de run, les profils restés en échec"""
+        if not self.profils_en_echec:
+            return
+        en_echec, self.profils_en_echec = sorted(self.profils_en_echec, key=lambda item: item[0]), []
+        self.metriques.definir('profils_en_echec', 0)
+        logger.info(f"🔁 Reprise de {len(en_echec)} profils en échec")
+        for profil_numero, profil_base in en_echec:
+            try:
+                profil_complet = self.enrichir_profil(dict(profil_base))
+                profil_complet['index'] = self.nb_profils_complets + 1
+                self.ajouter_profil_complet(profil_complet, profil_numero)
+                logger.info(f"✅ Profil {profil_numero} récupéré à la reprise")
+            except Exception as e:
+                logger.error(f"❌ Profil {profil_numero} définitivement en échec : {str(e)}")
+                self.noter_echec_profil(profil_numero, profil_base)
+        if self.profils_en_echec:
+            logger.warning(f"⚠️ {len(self.profils_en_echec)} profils non récupérés : "
+                           + ", ".join(str(numero) for numero, _ in self.profils_en_echec))
+    
+    def profil_a_ignorer(self, profil_numero, profil_base):
+        """Indique si un profil du catalogue doit être sauté (sans URL, déjà traité ou déjà connu)"""
+        url_profil = (profil_base or {}).get('url_profil')
+        # Sans lien, le schéma renvoie sa valeur par défaut ("Non disponible") au lieu d'une URL
+        if not url_profil or not str(url_profil).startswith(('http://', 'https://')):
+            logger.warning(f"⚠️ Profil {profil_numero} ignoré (pas d'URL)")
+            return True
+        if profil_base['url_profil'] in self.urls_deja_traitees:
+            logger.info(f"⏭️ Profil {profil_numero} déjà traité (reprise)")
+            return True
+        if self.incremental and profil_base['url_profil'] in self.profils_connus:
+            logger.info(f"⏭️ Profil {profil_numero} déjà connu (incrémental)")
+            return True
+        return False
+    
+    def cartes_toutes_connues(self, cartes):
+        """Vrai si une page de cartes ne contient que des profils déjà connus (mode incrémental)"""
+        return self.incremental and bool(cartes) and all(
+            carte['url_profil'] in self.profils_connus for carte in cartes
+        )
+    
+    def charger_profils_connus(self):
+        """Charge les URLs de profils déjà scrapés lors des exécutions précédentes"""
+        if os.path.exists(self.fichier_profils_connus):
+            with open(self.fichier_profils_connus, encoding='utf-8') as f:
+                self.profils_connus = set(json.load(f).get('urls', []))
+        logger.info(f"🗂️ Mode incrémental : {len(self.profils_connus)} profils déjà connus")
+    
+    def enregistrer_profils_connus(self):
+        """Ajoute les profils scrapés à la liste des profils connus (écriture atomique)"""
+        urls = sorted((self.profils_connus | self.urls_deja_traitees) - {None})
+        ecrire_json_atomique(self.fichier_profils_connus, {'mis_a_jour': datetime.now().isoformat(), 'urls': urls})
+        logger.info(f"🗂️ {len(urls)} profils connus enregistrés dans {self.fichier_profils_connus}")
+    
+    def ouvrir_sortie_jsonl(self):
+        """Ouvre le journal JSONL : en reprise, charge les profils déjà présents, sinon le vide"""
+        if self.reprise:
+            self.urls_deja_traitees = SortieJSONL.urls_deja_traitees(self.fichier_jsonl)
+            self.nb_profils_complets = len(self.urls_deja_traitees)
+            logger.info(f"♻️ Reprise : {self.nb_profils_complets} profils déjà présents dans {self.fichier_jsonl}")
+        self.sortie_jsonl = SortieJSONL(self.fichier_jsonl, reprise=self.reprise)
+    
+    def ajouter_profil_complet(self, profil_complet, profil_numero=None):
+        """Enregistre un profil terminé : écrit immédiatement dans le JSONL, sinon garde en mémoire
+
+        `profil_numero` est sa position dans le catalogue, qui sert à fusionner les shards.
+        """
+        if profil_numero is not None:
+            profil_complet['position_catalogue'] = profil_numero
+        if self.sortie_jsonl:
+            self.sortie_jsonl.ecrire(profil_complet)
+        else:
+            self.profils_complets.append(profil_complet)
+        self.urls_deja_traitees.add(profil_complet.get('url_profil'))
+        self.nb_profils_complets += 1
+        self.metriques.incrementer('profils_termines_total')
+        self.metriques.definir('derniere_activite_timestamp_secondes', time.time())
+        self.metriques.publier()
+    
+    def noter_echec_profil(self, profil_numero, profil_base):
+        """Met le profil de côté pour la reprise de fin de run et le compte dans les métriques"""
+        self.profils_en_echec.append((profil_numero, profil_base))
+        self.metriques.incrementer('profils_echoues_total')
+        self.metriques.definir('profils_en_echec', len(self.profils_en_echec))
+        self.metriques.definir('derniere_activite_timestamp_secondes', time.time())
+        self.metriques.publier()
+    
+    def collecter_metriques(self):
+        """Temps d'attente déjà cumulés par le limiteur de débit et les attentes adaptatives"""
+        with self.limiteur._verrou:
+            attentes_debit = dict(self.limiteur.attente_totale)
+        with self.attentes._verrou:
+            attentes_pages = {nom: sum(valeurs) for nom, valeurs in self.attentes.durees.items()}
+        for hote, total in attentes_debit.items():
+            yield 'attente_secondes_total', {'type': 'debit', 'hote': hote}, total
+        for nom, total in attentes_pages.items():
+            yield 'attente_secondes_total', {'type': 'page', 'attente': nom}, total
+    
+    def profils_a_sauvegarder(self):
+        """Itère sur tous les profils terminés, depuis le JSONL s'il est actif"""
+        if self.sortie_jsonl:
+            return SortieJSONL.lire(self.fichier_jsonl)
+        return iter(self.profils_complets)
+    
+    @phase_chronometree('sauvegarder_resultats')
     def sauvegarder_resultats(self):
         """Sauvegarde les résultats complets"""
-        if not self.profils_complets:
+        if self.nb_profils_complets == 0:
             logger.warning("⚠️ Aucun profil à sauvegarder")
             return
+        
+        if self.sortie_jsonl:
+            self.sortie_jsonl.fermer()
             
+        os.makedirs(self.dossier_sortie, exist_ok=True)
         timestamp = int(time.time())
+        prefixe = os.path.join(self.dossier_sortie, f'profils_tony_complets_integrated_{timestamp}')
+        
+        # Sauvegarder en JSON, profil par profil pour ne pas tout charger en mémoire
+        if 'json' in self.formats:
+            json_filename = f'{prefixe}.json'
+            with open(json_filename, 'w', encoding='utf-8') as f:
+                f.write("[\n")
+                for position, profil in enumerate(self.profils_a_sauvegarder()):
+                    if position:
+                        f.write(",\n")
+                    f.write("  " + json.dumps(profil, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+                f.write("\n]")
+            logger.info(f"✅ Sauvegardé : {json_filename}")
         
-        # Sauvegarder en JSON
-        json_filename = f'profils_tony_complets_integrated_{timestamp}.json'
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(self.profils_complets, f, ensure_ascii=False, indent=2)
-        logger.info(f"✅ Sauvegardé : {json_filename}")
+        # Sauvegarder en JSONL, une ligne par profil
+        if 'jsonl' in self.formats:
+            jsonl_filename = f'{prefixe}.jsonl'
+            with open(jsonl_filename, 'w', encoding='utf-8') as f:
+                for profil in self.profils_a_sauvegarder():
+                    f.write(json.dumps(profil, ensure_ascii=False) + "\n")
+            logger.info(f"✅ Sauvegardé : {jsonl_filename}")
         
         # Sauvegarder en CSV
-        csv_filename = f'profils_tony_complets_integrated_{timestamp}.csv'
-        try:
-            with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-                if self.profils_complets:
+        if 'csv' in self.formats:
+            csv_filename = f'{prefixe}.csv'
+            try:
+                with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
                     # Obtenir tous les champs possibles
                     all_fields = set()
-                    for profil in self.profils_complets:
+                    for profil in self.profils_a_sauvegarder():
                         all_fields.update(profil.keys())
                     
                     fieldnames = sorted(list(all_fields))
                     writer = csv.DictWriter(f, fieldnames=fieldnames)
                     writer.writeheader()
-                    writer.writerows(self.profils_complets)
-            logger.info(f"✅ Sauvegardé : {csv_filename}")
-        except Exception as e:
-            logger.error(f"❌ Erreur lors de la sauvegarde CSV : {str(e)}")
+                    writer.writerows(self.profils_a_sauvegarder())
+                logger.info(f"✅ Sauvegardé : {csv_filename}")
+            except Exception as e:
+                logger.error(f"❌ Erreur lors de la sauvegarde CSV : {str(e)}")
     
+    def reextraire_archive(self, processus=1):
+        """Rejoue l'extraction sur les pages de l'archive, sans navigateur ni réseau
+
+        Les pages de catalogue archivées, rangées par `ordre` (page affichée puis fragments XHR
+        dans l'ordre de pagination), donnent les infos de base et la position de chaque
+        profil ; la dernière version de chaque page de détail est analysée avec le schéma
+        courant, en parallèle sur `processus` processus. Les liens forward/ ne sont résolus
+        que par le cache de redirections. Retourne True si au moins un profil a été extrait.
+        """
+        debut = time.monotonic()
+        cartes = {}
+        for entree in sorted(self.archive.dernieres_entrees('catalogue'), key=lambda entree: entree.get('ordre', 0)):
+            html = self.archive.lire(entree['empreinte'])
+            for carte in extraire_cartes_html(html, entree['url'], None, self.schema):
+                if carte.get('url_profil'):
+                    cartes.setdefault(carte['url_profil'], carte)
+        positions = {url: position for position, url in enumerate(cartes, 1)}
+
+        pages = self.archive.dernieres_entrees('detail')
+        if not pages:
+            logger.error(f"❌ Aucune page de profil dans l'archive {self.archive.dossier}")
+            return False
+        pages.sort(key=lambda entree: (entree['url'] not in positions, positions.get(entree['url'], 0)))
+        logger.info(f"🗃️ Réextraction de {len(pages)} profils ({len(cartes)} cartes de catalogue) "
+                     f"sur {processus} processus")
+
+        arguments = (
+            [self.archive.chemin_objet(entree['empreinte']) for entree in pages],
+            [entree['url'] for entree in pages],
+            [self.schema] * len(pages),
+        )
+        if processus > 1:
+            with ProcessPoolExecutor(max_workers=processus) as executeur:
+                resultats = list(executeur.map(reextraire_page_archivee, *arguments,
+                                               chunksize=max(1, len(pages) // (4 * processus))))
+        else:
+            resultats = list(map(reextraire_page_archivee, *arguments))
+
+        if self.fichier_jsonl:
+            self.ouvrir_sortie_jsonl()
+        reextrait_le = datetime.now().isoformat()
+        for entree, champs in zip(pages, resultats):
+            if champs is None:
+                logger.warning(f"⚠️ Page archivée illisible ignorée : {entree['url']} ({entree['empreinte']})")
+                continue
+            lien_forward = champs.pop('lien_forward', None)
+            lien_direct = champs.pop('lien_linkedin_direct', None)
+            if lien_forward:
+                linkedin_url = (self.cache_redirections.lire(lien_forward) if self.cache_redirections else None) or lien_forward
+            else:
+                linkedin_url = lien_direct or ""
+            profil_complet = {
+                **cartes.get(entree['url'], {'index': None, 'url_profil': entree['url']}), **champs,
+                'scraped_at': entree['recupere_le'], 'reextrait_le': reextrait_le, 'linkedin_url': linkedin_url,
+            }
+            profil_complet['index'] = self.nb_profils_complets + 1
+            self.ajouter_profil_complet(profil_complet, positions.get(entree['url']))
+
+        self.sauvegarder_resultats()
+        if self.sortie_jsonl:
+            self.sortie_jsonl.fermer()
+        logger.info(f"✅ {self.nb_profils_complets} profils réextraits en {time.monotonic() - debut:.1f}s")
+        return self.nb_profils_complets > 0
+
     def run(self):
-        """Exécute le scraping complet"""
+        """Exécute le scraping complet, retourne True si le catalogue a été traité"""
+        succes = False
         try:
             logger.info("🚀 Démarrage du scraping complet intégré")
+            if self.port_metriques is not None:
+                self.metriques.servir(self.port_metriques, self.adresse_metriques)
             self.setup_driver()
             
-            # Connexion
-            if not self.connexion_espace_participant():
-                logger.error("❌ Impossible de se connecter")
-                return
+            # Session déjà connectée (cookies ou profil Chrome), sinon connexion complète
+            if not self.restaurer_session():
+                # Connexion
+                if not self.connexion_espace_participant():
+                    logger.error("❌ Impossible de se connecter")
+                    return False
+                self.sauvegarder_cookies()
+                
+                # Navigation vers le catalogue
+                if not self.navigation_catalogue():
+                    logger.error("❌ Impossible d'accéder au catalogue")
+                    return False
             
-            # Navigation vers le catalogue
-            if not self.navigation_catalogue():
-                logger.error("❌ Impossible d'accéder au catalogue")
-                return
+            # Profils déjà connus pour le mode incrémental
+            if self.incremental:
+                self.charger_profils_connus()
+            
+            # Journal JSONL écrit au fil de l'eau
+            if self.fichier_jsonl:
+                self.ouvrir_sortie_jsonl()
+            
+            # Session HTTP partageant les cookies du navigateur
+            if self.mode_http or self.pagination_directe or self.redirections_http:
+                self.exporter_session_http()
             
             # Scraping complet des profils
             if self.scraper_profils_catalogue():
+                self.reprendre_profils_en_echec()
                 # Sauvegarde
                 self.sauvegarder_resultats()
-                logger.info(f"✅ Scraping terminé : {len(self.profils_complets)} profils complets")
+                if self.incremental:
+                    self.enregistrer_profils_connus()
+                logger.info(f"✅ Scraping terminé : {self.nb_profils_complets} profils complets")
+                succes = True
             else:
                 logger.error("❌ Échec du scraping du catalogue")
             
         except Exception as e:
             logger.error(f"❌ Erreur lors de l'exécution : {str(e)}")
         finally:
+            if self.sortie_jsonl:
+                self.sortie_jsonl.fermer()
+            self.resolveur.sauvegarder()
+            for champ, selecteurs in self.resolveur.selecteurs_morts(ignorer=self.schema.champs_sans_secours()).items():
+                logger.info(f"🪦 Sélecteurs morts pour '{champ}' : {', '.join(selecteurs)}")
+            if self.cache_redirections:
+                self.cache_redirections.sauvegarder()
+                logger.info(f"🗄️ Cache de redirections : {self.cache_redirections.resume()}")
+            if self.attentes.durees:
+                logger.info("⏱️ Durée des attentes :\n" + self.attentes.resume())
+            if self.limiteur.budgets:
+                logger.info(f"🚦 Budget de requêtes : {self.limiteur.resume()}")
+            if self.phases.durees:
+                logger.info("📐 Durée des phases :\n" + self.phases.resume())
+            self.phases.fermer()
+            self.metriques.arreter()
+            if self.archive:
+                self.archive.fermer()
+                logger.info(f"🗃️ Archive : {self.archive.resume()}")
+            if self.profileur_webdriver and self.profileur_webdriver.statistiques:
+                logger.info("🔬 Commandes WebDriver :\n" + self.profileur_webdriver.resume())
+                self.profileur_webdriver.sauvegarder()
             if self.driver:
                 self.driver.quit()
+        return succes
+
+class CoordinateurShards:
+    """Répartit une plage du catalogue entre plusieurs processus workers et fusionne leurs JSONL
+
+    Chaque worker est une exécution non interactive de ce script (--debut, --nombre, --jsonl,
+    navigateur sans interface) avec sa propre session, lancée localement ou via ssh sur l'un
+    des hôtes ('machine' ou 'machine:dossier_du_script'). Les fichiers d'entrée des workers
+    (schéma, cookies) sont copiés par scp dans le dossier de chaque hôte distant avant le
+    lancement, les workers distants recevant le chemin de la copie. La fusion trie les profils par
+    position dans le catalogue et supprime les doublons d'URL : le résultat ne dépend pas
+    de l'ordre dans lequel les workers terminent.
+    """
+
+    def __init__(self, position_depart, nombre_profils, nb_shards, dossier, hotes=None,
+                 options_workers=None, reprise=False, fichiers_workers=None):
+        self.plages = self.decouper(position_depart, nombre_profils, nb_shards)
+        self.dossier = dossier
+        self.hotes = hotes or []
+        self.options_workers = options_workers or []
+        self.reprise = reprise
+        # (option, chemin local) des fichiers lus par les workers, ex. ('--schema', 'schema.json')
+        self.fichiers_workers = fichiers_workers or []
+
+    @staticmethod
+    def decouper(position_depart, nombre_profils, nb_shards):
+        """Plages (début, nombre) contiguës et de tailles équilibrées couvrant la demande"""
+        taille, reste = divmod(nombre_profils, nb_shards)
+        plages = []
+        debut = position_depart
+        for numero in range(nb_shards):
+            nombre = taille + (1 if numero < reste else 0)
+            if nombre:
+                plages.append((debut, nombre))
+            debut += nombre
+        return plages
+
+    def chemin_shard(self, numero):
+        return os.path.join(self.dossier, f"shard_{numero:03d}.jsonl")
+
+    @staticmethod
+    def nom_copie_distante(option, chemin):
+        """Nom de la copie d'un fichier d'entrée dans le dossier de l'hôte distant"""
+        return f"tony_{option.lstrip('-')}_{os.path.basename(chemin)}"
+
+    def fichiers_a_copier(self):
+        """Fichiers d'entrée présents localement (un fichier de cookies peut ne pas encore exister)"""
+        return [(option, chemin) for option, chemin in self.fichiers_workers if os.path.exists(chemin)]
+
+    def commandes_copie(self, hote):
+        """Commandes scp qui déposent les fichiers d'entrée des workers sur un hôte distant"""
+        machine, _, dossier_distant = hote.partition(':')
+        dossier_distant = dossier_distant or '.'
+        return [
+            ['scp', '-q', chemin, f"{machine}:{posixpath.join(dossier_distant, self.nom_copie_distante(option, chemin))}"]
+            for option, chemin in self.fichiers_a_copier()
+        ]
+
+    def commande_worker(self, numero, debut, nombre):
+        """Retourne la commande du worker et, s'il est distant, (machine, chemin du JSONL distant)"""
+        arguments = ['--debut', str(debut), '--nombre', str(nombre), '--sans-interface', *self.options_workers]
+        if self.reprise:
+            arguments.append('--resume')
+        if not self.hotes:
+            for option, chemin in self.fichiers_workers:
+                arguments += [option, os.path.abspath(chemin)]
+            script = os.path.abspath(__file__)
+            return [sys.executable, script, '--jsonl', self.chemin_shard(numero), *arguments], None
+
+        machine, _, dossier_distant = self.hotes[numero % len(self.hotes)].partition(':')
+        dossier_distant = dossier_distant or '.'
+        for option, chemin in self.fichiers_a_copier():
+            arguments += [option, self.nom_copie_distante(option, chemin)]
+        jsonl_distant = posixpath.join(dossier_distant, os.path.basename(self.chemin_shard(numero)))
+        commande_distante = " ".join([
+            "cd", shlex.quote(dossier_distant), "&&", "python3", shlex.quote(os.path.basename(__file__)),
+            "--jsonl", shlex.quote(os.path.basename(jsonl_distant)), *map(shlex.quote, arguments),
+        ])
+        return ['ssh', machine, commande_distante], (machine, jsonl_distant)
+
+    def executer(self, chemin_sortie):
+        """Lance tous les workers, attend leur fin et fusionne ; retourne le nombre de shards en échec"""
+        os.makedirs(self.dossier, exist_ok=True)
+        if not self.reprise:
+            # Sans reprise, les JSONL d'une exécution précédente ne doivent pas être fusionnés
+            for numero in range(len(self.plages)):
+                if os.path.exists(self.chemin_shard(numero)):
+                    os.remove(self.chemin_shard(numero))
+        # Fichiers d'entrée déposés une fois par hôte distant ; un hôte injoignable fait échouer ses shards
+        hotes_prets = {}
+        for hote in self.hotes:
+            if hote not in hotes_prets:
+                hotes_prets[hote] = all(subprocess.run(commande).returncode == 0 for commande in self.commandes_copie(hote))
+                if not hotes_prets[hote]:
+                    logger.error(f"❌ Copie des fichiers d'entrée impossible vers {hote}")
+        workers = []
+        echecs = 0
+        for numero, (debut, nombre) in enumerate(self.plages):
+            if self.hotes and not hotes_prets[self.hotes[numero % len(self.hotes)]]:
+                echecs += 1
+                continue
+            commande, distant = self.commande_worker(numero, debut, nombre)
+            journal = open(os.path.join(self.dossier, f"shard_{numero:03d}.log"), 'a', encoding='utf-8')
+            logger.info(f"🚚 Shard {numero} : profils {debut} à {debut + nombre - 1} ({distant[0] if distant else 'local'})")
+            processus = subprocess.Popen(commande, stdout=journal, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL)
+            workers.append((numero, processus, journal, distant))
+
+        for numero, processus, journal, distant in workers:
+            code = processus.wait()
+            journal.close()
+            if distant:
+                machine, jsonl_distant = distant
+                copie = subprocess.run(['scp', '-q', f"{machine}:{jsonl_distant}", self.chemin_shard(numero)])
+                code = code or copie.returncode
+            if code:
+                echecs += 1
+                logger.error(f"❌ Shard {numero} en échec (code {code}), voir {self.dossier}/shard_{numero:03d}.log")
+            else:
+                logger.info(f"✅ Shard {numero} terminé")
+
+        self.fusionner(chemin_sortie)
+        return echecs
+
+    def fusionner(self, chemin_sortie):
+        """Fusionne les JSONL des shards par position dans le catalogue, sans doublon d'URL"""
+        profils = []
+        for numero in range(len(self.plages)):
+            if os.path.exists(self.chemin_shard(numero)):
+                profils.extend(SortieJSONL.lire(self.chemin_shard(numero)))
+        # Tri stable : à position égale ou inconnue, l'ordre des shards est conservé
+        profils.sort(key=lambda profil: (profil.get('position_catalogue') is None, profil.get('position_catalogue') or 0))
+
+        urls_vues = set()
+        temporaire = f"{chemin_sortie}.tmp"
+        nb_profils = 0
+        with open(temporaire, 'w', encoding='utf-8') as f:
+            for profil in profils:
+                if profil.get('url_profil') in urls_vues:
+                    continue
+                urls_vues.add(profil.get('url_profil'))
+                nb_profils += 1
+                f.write(json.dumps({**profil, 'index': nb_profils}, ensure_ascii=False) + "\n")
+        os.replace(temporaire, chemin_sortie)
+        logger.info(f"🧵 {nb_profils} profils fusionnés depuis {len(self.plages)} shards : {chemin_sortie}")
+        return nb_profils
+
 
 def main():
     """Fonction principale simplifiée"""
-    print("🚀 Scraping Tony - Le Spot Automation")
-    print("=" * 40)
-    print("Ce script va :")
-    print("1. Se connecter au site")
-    print("2. Naviguer vers le catalogue")
-    print("3. Trier par 'Derniers inscrits'")
-    print("4. Charger tous les profils")
-    print("5. Vous demander quels profils scraper")
-    print("=" * 40)
-    
-    input("\nAppuyez sur Entrée pour commencer...")
-    
-    scraper = TonyCompletIntegratedScraper()
-    scraper.run()
+    parser = argparse.ArgumentParser(description="Scraping complet intégré des profils Le Spot")
+    parser.add_argument('nombre_profils', nargs='?', type=int, help="raccourci pour --nombre")
+    parser.add_argument('--config', help="fichier JSON d'options (clés = noms des options), pour les exécutions planifiées")
+    parser.add_argument('--jsonl', help="journal JSONL où chaque profil est écrit dès qu'il est terminé")
+    parser.add_argument('--debut', type=int, default=1, help="numéro du premier profil à traiter (1 = premier)")
+    parser.add_argument('--nombre', type=int,
+                        help="nombre de profils à traiter (0 = tous) ; sans cette option il est demandé")
+    parser.add_argument('--sans-interface', action='store_true', help="lancer Chrome sans interface (headless)")
+    parser.add_argument('--concurrence', type=int, default=1,
+                        help="nombre de navigateurs scrapant les profils en parallèle "
+                             "(processus d'analyse avec --re-extraire, par défaut un par CPU)")
+    parser.add_argument('--http', action='store_true',
+                        help="télécharger les pages de profil en HTTP direct, le navigateur ne servant que de secours")
+    parser.add_argument('--pagination-directe', action='store_true',
+                        help="charger le catalogue via la requête XHR de 'Voir plus' au lieu de cliquer")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="scraper les profils pendant le chargement du catalogue")
+    parser.add_argument('--debit-site', type=float, default=3.0,
+                        help="requêtes par seconde autorisées vers le site (pages, XHR, clics 'Voir plus')")
+    parser.add_argument('--debit-autres-hotes', type=float, default=1.0,
+                        help="requêtes par seconde autorisées vers chacun des autres hôtes (redirections forward/)")
+    parser.add_argument('--max-requetes-simultanees', type=int, default=8,
+                        help="nombre maximal de requêtes en vol, tous navigateurs et sessions HTTP confondus")
+    parser.add_argument('--tentatives', type=int, default=3,
+                        help="nombre maximal de tentatives par profil en cas d'erreur passagère")
+    parser.add_argument('--budget-profil', type=float, default=120.0,
+                        help="temps maximal en secondes consacré à un profil, tentatives comprises")
+    parser.add_argument('--spans',
+                        help="fichier JSONL où écrire la durée de chaque phase et de chaque profil")
+    parser.add_argument('--profil-webdriver',
+                        help="compter et chronométrer chaque commande WebDriver par type et par méthode, "
+                             "profil écrit en JSON dans ce fichier")
+    parser.add_argument('--port-metriques', type=int,
+                        help="exposer les métriques Prometheus sur http://ADRESSE:PORT/metrics pendant le run")
+    parser.add_argument('--adresse-metriques', default="127.0.0.1",
+                        help="adresse d'écoute de l'endpoint de métriques (0.0.0.0 dans un conteneur)")
+    parser.add_argument('--fichier-metriques',
+                        help="fichier .prom réécrit au fil du run pour le collecteur textfile de node_exporter")
+    parser.add_argument('--archive',
+                        help="dossier où archiver chaque page de catalogue et de profil récupérée (gzip, adressée par contenu)")
+    parser.add_argument('--re-extraire', action='store_true',
+                        help="rejouer l'extraction (--schema) sur les pages de --archive, sans navigateur, puis quitter")
+    parser.add_argument('--dossier-sortie', default=".", help="dossier des fichiers de résultats")
+    parser.add_argument('--formats', default="json,csv",
+                        help="formats des résultats séparés par des virgules : json, csv, jsonl (vide pour aucun)")
+    parser.add_argument('--shards', type=int,
+                        help="mode coordinateur : répartir --debut/--nombre entre N workers puis fusionner")
+    parser.add_argument('--hotes',
+                        help="hôtes ssh des workers, séparés par des virgules ('machine' ou 'machine:dossier')")
+    parser.add_argument('--dossier-shards', default="shards_tony",
+                        help="dossier des journaux JSONL et logs de chaque shard")
+    parser.add_argument('--resume', action='store_true',
+                        help="reprendre le journal --jsonl en sautant les profils déjà présents")
+    parser.add_argument('--incremental', action='store_true',
+                        help="ne scraper que les nouveaux inscrits depuis la dernière exécution")
+    parser.add_argument('--profils-connus', default="profils_tony_connus.json",
+                        help="fichier des profils déjà connus pour --incremental")
+    parser.add_argument('--redirections-navigateur', action='store_true',
+                        help="résoudre les liens LinkedIn dans un onglet au lieu de suivre les redirections en HTTP")
+    parser.add_argument('--leger', action='store_true',
+                        help="navigateur sans interface qui bloque images, médias, polices et traqueurs")
+    parser.add_argument('--cache-redirections', default="cache_redirections_tony.json",
+                        help="cache disque des liens forward/ déjà résolus (vide pour désactiver)")
+    parser.add_argument('--classement-selecteurs', default="selecteurs_tony.json",
+                        help="statistiques des sélecteurs de secours, pour repérer les sélecteurs morts (vide pour ne pas les conserver)")
+    parser.add_argument('--schema',
+                        help="fichier JSON qui complète ou remplace les champs du schéma d'extraction")
+    parser.add_argument('--cookies',
+                        help="fichier de cookies de session réutilisé entre les exécutions")
+    parser.add_argument('--profil-chrome',
+                        help="dossier de profil Chrome (--user-data-dir) conservé entre les exécutions")
+    # Les options du fichier --config servent de valeurs par défaut à la ligne de commande
+    pre_args, _ = parser.parse_known_args()
+    if pre_args.config:
+        try:
+            with open(pre_args.config, encoding='utf-8') as f:
+                config = {cle.replace('-', '_'): valeur for cle, valeur in json.load(f).items()}
+        except (OSError, json.JSONDecodeError) as e:
+            parser.error(f"fichier --config illisible : {str(e)}")
+        options_connues = {action.dest for action in parser._actions}
+        inconnues = sorted(set(config) - options_connues)
+        if inconnues:
+            parser.error(f"options inconnues dans --config : {', '.join(inconnues)}")
+        parser.set_defaults(**config)
+    args = parser.parse_args()
+    if args.nombre is None:
+        args.nombre = args.nombre_profils
+    # --formats est une chaîne séparée par des virgules, ou une liste dans le fichier --config
+    formats = args.formats if isinstance(args.formats, list) else str(args.formats).split(',')
+    formats = [str(fmt).strip() for fmt in formats if str(fmt).strip()]
+    if set(formats) - {'json', 'csv', 'jsonl'}:
+        parser.error("--formats n'accepte que json, csv et jsonl")
+    if args.concurrence < 1:
+        parser.error("--concurrence doit être >= 1")
+    if args.tentatives < 1 or args.budget_profil <= 0:
+        parser.error("--tentatives doit être >= 1 et --budget-profil > 0")
+    if args.debit_site <= 0 or args.debit_autres_hotes <= 0 or args.max_requetes_simultanees < 1:
+        parser.error("les débits doivent être > 0 et --max-requetes-simultanees >= 1")
+    if args.re_extraire and not (args.archive and os.path.isdir(args.archive)):
+        parser.error("--re-extraire nécessite le dossier d'une archive existante (--archive)")
+    if args.nombre is None and not sys.stdin.isatty() and not args.re_extraire:
+        parser.error("--nombre (ou nombre_profils) est requis sans terminal interactif")
+    if args.resume and not args.jsonl and not args.shards:
+        parser.error("--resume nécessite --jsonl")
+    if args.debut < 1:
+        parser.error("--debut doit être >= 1")
+    
+    if args.re_extraire:
+        scraper = TonyCompletIntegratedScraper(
+            fichier_jsonl=args.jsonl,
+            fichier_cache_redirections=args.cache_redirections or None,
+            fichier_selecteurs=None,
+            fichier_schema=args.schema,
+            dossier_sortie=args.dossier_sortie,
+            formats=formats,
+            dossier_archive=args.archive
+        )
+        processus = args.concurrence if args.concurrence > 1 else (os.cpu_count() or 1)
+        sys.exit(0 if scraper.reextraire_archive(processus) else 1)
+    
+    if args.shards:
+        if not args.nombre or args.shards < 1:
+            parser.error("--shards nécessite --nombre > 0 et au moins un shard")
+        options_workers = []
+        if args.leger:
+            options_workers.append('--leger')
+        if args.redirections_navigateur:
+            options_workers.append('--redirections-navigateur')
+        if args.archive:
+            if args.hotes:
+                parser.error("--archive n'est pas disponible avec --hotes : l'archive resterait sur les hôtes distants")
+            options_workers += ['--archive', os.path.abspath(args.archive)]
+        # Fichiers lus par les workers : copiés sur les hôtes distants par le coordinateur
+        fichiers_workers = [(option, chemin) for option, chemin in (('--schema', args.schema), ('--cookies', args.cookies))
+                            if chemin]
+        for option, actif in (('--http', args.http), ('--pagination-directe', args.pagination_directe),
+                              ('--pipeline', args.pipeline)):
+            if actif:
+                options_workers.append(option)
+        # Les workers n'écrivent que leur journal JSONL, fusionné par le coordinateur
+        options_workers += ['--concurrence', str(args.concurrence), '--formats=']
+        # Le budget du site est partagé entre les workers, qui visent tous le même serveur
+        options_workers += [
+            '--debit-site', str(args.debit_site / args.shards),
+            '--debit-autres-hotes', str(args.debit_autres_hotes / args.shards),
+            '--max-requetes-simultanees', str(args.max_requetes_simultanees),
+            '--tentatives', str(args.tentatives), '--budget-profil', str(args.budget_profil),
+        ]
+        coordinateur = CoordinateurShards(
+            args.debut, args.nombre, args.shards, args.dossier_shards,
+            hotes=[hote.strip() for hote in args.hotes.split(',') if hote.strip()] if args.hotes else None,
+            options_workers=options_workers,
+            reprise=args.resume,
+            fichiers_workers=fichiers_workers
+        )
+        echecs = coordinateur.executer(args.jsonl or os.path.join(args.dossier_shards, "profils_tony_fusion.jsonl"))
+        sys.exit(1 if echecs else 0)
+    
+    # Présentation et confirmation uniquement en mode interactif
+    if args.nombre is None:
+        print("🚀 Scraping Tony - Le Spot Automation")
+        print("=" * 40)
+        print("Ce script va :")
+        print("1. Se connecter au site")
+        print("2. Naviguer vers le catalogue")
+        print("3. Trier par 'Derniers inscrits'")
+        print("4. Charger tous les profils")
+        print("5. Vous demander quels profils scraper")
+        print("=" * 40)
+        
+        input("\nAppuyez sur Entrée pour commencer...")
+    
+    scraper = TonyCompletIntegratedScraper(
+        fichier_jsonl=args.jsonl,
+        reprise=args.resume,
+        incremental=args.incremental,
+        fichier_profils_connus=args.profils_connus,
+        fichier_cookies=args.cookies,
+        dossier_profil_chrome=args.profil_chrome,
+        redirections_http=not args.redirections_navigateur,
+        fichier_cache_redirections=args.cache_redirections or None,
+        mode_leger=args.leger,
+        fichier_selecteurs=args.classement_selecteurs or None,
+        fichier_schema=args.schema,
+        nombre_profils=args.nombre,
+        position_depart=args.debut,
+        sans_interface=args.sans_interface,
+        concurrence=args.concurrence,
+        mode_http=args.http,
+        pagination_directe=args.pagination_directe,
+        pipeline=args.pipeline,
+        dossier_sortie=args.dossier_sortie,
+        formats=formats,
+        debit_site=args.debit_site,
+        debit_autres_hotes=args.debit_autres_hotes,
+        max_requetes_simultanees=args.max_requetes_simultanees,
+        max_tentatives=args.tentatives,
+        budget_profil=args.budget_profil,
+        fichier_spans=args.spans,
+        fichier_profil_webdriver=args.profil_webdriver,
+        port_metriques=args.port_metriques,
+        adresse_metriques=args.adresse_metriques,
+        fichier_metriques=args.fichier_metriques,
+        dossier_archive=args.archive
+    )
+    sys.exit(0 if scraper.run() else 1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
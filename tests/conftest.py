@@ -0,0 +1,40 @@
+"""Fixtures communes : faux site Le Spot local et scraper sans navigateur"""
+
+import os
+import sys
+import threading
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import banc_essai_tony  # noqa: E402
+from scraping_tony_complet_integrated import TonyCompletIntegratedScraper  # noqa: E402
+
+
+@pytest.fixture
+def site():
+    """Site de test de banc_essai_tony : 45 profils, 20 cartes par page de 'Voir plus'"""
+    serveur = banc_essai_tony.SiteTest(("127.0.0.1", 0), nb_profils=45, taille_page=20)
+    threading.Thread(target=serveur.serve_forever, daemon=True).start()
+    yield serveur
+    serveur.shutdown()
+    serveur.server_close()
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    """Scraper sans navigateur ni fichiers persistants, session HTTP déjà connectée au site de test"""
+    instance = TonyCompletIntegratedScraper(
+        fichier_cache_redirections=None,
+        fichier_selecteurs=None,
+        fichier_profils_connus=str(tmp_path / "profils_connus.json"),
+        dossier_sortie=str(tmp_path),
+        debit_site=1000.0,
+        debit_autres_hotes=1000.0,
+    )
+    instance.session_http = requests.Session()
+    instance.session_http.cookies.set(banc_essai_tony.COOKIE_SESSION, "ok")
+    yield instance
+    instance.phases.fermer()
@@ -0,0 +1,47 @@
+"""Archive des pages brutes : ordre des pages du catalogue et ré-extraction hors ligne"""
+
+import json
+
+import banc_essai_tony
+from scraping_tony_complet_integrated import ArchivePages
+
+
+def test_paginer_catalogue_xhr_archive_les_fragments_dans_l_ordre(site, scraper, tmp_path):
+    scraper.archive = ArchivePages(str(tmp_path / "archive"))
+    requete = {
+        'url': f"{site.url}{banc_essai_tony.CHEMIN_CATALOGUE}/more?page=0",
+        'methode': 'GET', 'corps': None, 'en_tetes': {'X-Requested-With': 'XMLHttpRequest'},
+        'emplacement': 'url', 'parametre': 'page', 'valeur': 0, 'pas': 1,
+    }
+    list(scraper.paginer_catalogue_xhr(requete))
+    scraper.archive.fermer()
+
+    entrees = scraper.archive.dernieres_entrees('catalogue')
+    assert [entree['ordre'] for entree in entrees] == [1, 2]
+
+
+def test_reextraire_archive_positions_du_catalogue(scraper, tmp_path):
+    archive = ArchivePages(str(tmp_path / "archive"))
+    base = "https://site"
+    # Fragment XHR archivé avant la page affichée (pipeline / pagination directe)
+    archive.ajouter(f"{base}/more?page=1", 'catalogue',
+                    "".join(banc_essai_tony.carte_html(i) for i in range(21, 41)), 'http', ordre=1)
+    archive.ajouter(f"{base}/catalog", 'catalogue',
+                    "".join(banc_essai_tony.carte_html(i) for i in range(1, 21)), 'navigateur', ordre=0)
+    for i in (25, 2):
+        archive.ajouter(f"{base}/fr/profile/{i}", 'detail', banc_essai_tony.profil_html(i), 'http')
+    archive.ajouter(f"{base}/fr/profile/9", 'detail', banc_essai_tony.profil_html(9), 'http')
+    open(archive.chemin_objet(archive.dernieres_entrees('detail')[-1]['empreinte']), 'wb').write(b"corrompu")
+    archive.fermer()
+
+    scraper.archive = archive
+    scraper.formats = ('jsonl',)
+    assert scraper.reextraire_archive(processus=1)
+
+    (sortie,) = tmp_path.glob("profils_tony_complets_integrated_*.jsonl")
+    profils = [json.loads(ligne) for ligne in sortie.read_text(encoding='utf-8').splitlines()]
+    assert [(profil['url_profil'], profil['position_catalogue']) for profil in profils] == [
+        (f"{base}/fr/profile/2", 2), (f"{base}/fr/profile/25", 25),
+    ]
+    assert profils[1]['entreprise'] == "Entreprise 25"
+    assert profils[1]['secteur_activite'] == "Secteur 1"
@@ -0,0 +1,38 @@
+"""Écriture atomique des fichiers partagés entre exécutions et workers"""
+
+import json
+import os
+import stat
+
+import pytest
+
+from scraping_tony_complet_integrated import ecrire_fichier_atomique, ecrire_json_atomique
+
+
+def test_ecrire_json_atomique_remplace_sans_temporaire(tmp_path):
+    chemin = tmp_path / "profils_connus.json"
+    chemin.write_text("ancien", encoding='utf-8')
+
+    ecrire_json_atomique(str(chemin), {'urls': ["https://site/fr/profile/é"]})
+
+    assert json.loads(chemin.read_text(encoding='utf-8')) == {'urls': ["https://site/fr/profile/é"]}
+    assert os.listdir(tmp_path) == ["profils_connus.json"]
+
+
+def test_ecrire_json_atomique_permissions(tmp_path):
+    chemin = tmp_path / "cookies.json"
+
+    ecrire_json_atomique(str(chemin), [], permissions=0o600)
+
+    assert stat.S_IMODE(chemin.stat().st_mode) == 0o600
+
+
+def test_ecrire_fichier_atomique_echec_conserve_l_original(tmp_path):
+    chemin = tmp_path / "metriques.prom"
+    chemin.write_text("original", encoding='utf-8')
+
+    with pytest.raises(TypeError):
+        ecrire_fichier_atomique(str(chemin), None)
+
+    assert chemin.read_text(encoding='utf-8') == "original"
+    assert os.listdir(tmp_path) == ["metriques.prom"]
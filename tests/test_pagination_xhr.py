@@ -0,0 +1,79 @@
+"""Pagination directe du catalogue : analyse de la requête 'Voir plus' et pages XHR"""
+
+import json
+
+import requests
+
+import banc_essai_tony
+from scraping_tony_complet_integrated import (
+    analyser_pagination, fragments_html_reponse, remplacer_parametre
+)
+
+
+def reponse(corps, type_contenu):
+    resultat = requests.Response()
+    resultat.status_code = 200
+    resultat._content = corps.encode('utf-8')
+    resultat.headers['Content-Type'] = type_contenu
+    resultat.encoding = 'utf-8'
+    return resultat
+
+
+def requete_voir_plus(site, page=1):
+    """Requête telle que decouvrir_requete_voir_plus la décrit après un clic sur 'Voir plus'"""
+    return {
+        'url': f"{site.url}{banc_essai_tony.CHEMIN_CATALOGUE}/more?page={page}",
+        'methode': 'GET', 'corps': None, 'en_tetes': {'X-Requested-With': 'XMLHttpRequest'},
+        'emplacement': 'url', 'parametre': 'page', 'valeur': page, 'pas': 1,
+    }
+
+
+def test_analyser_pagination_parametre_de_page_dans_url():
+    assert analyser_pagination("https://site/fr/catalog/more?sort=2&page=3", None) == ('url', 'page', 3)
+
+
+def test_analyser_pagination_decalage_dans_corps_prioritaire():
+    assert analyser_pagination("https://site/more?v=7", "limit=20&offset=40") == ('corps', 'offset', 40)
+
+
+def test_analyser_pagination_parametre_inconnu_ignore():
+    # Un identifiant de fiche ou de catégorie ne doit pas être parcouru comme une page
+    assert analyser_pagination("https://site/more?sheet=926247&categorie=3", None) is None
+    assert analyser_pagination("https://site/more?tri=nom", "") is None
+
+
+def test_remplacer_parametre_url_et_corps():
+    url, corps = remplacer_parametre("https://site/more?sort=2&page=3", "a=1", 'url', 'page', 4)
+    assert url == "https://site/more?sort=2&page=4"
+    assert corps == "a=1"
+
+    url, corps = remplacer_parametre("https://site/more", "limit=20&offset=40", 'corps', 'offset', 60)
+    assert url == "https://site/more"
+    assert corps == "limit=20&offset=60"
+
+
+def test_fragments_html_reponse_html_brut():
+    assert fragments_html_reponse(reponse("<div>a</div>", "text/html")) == ["<div>a</div>"]
+
+
+def test_fragments_html_reponse_json_imbrique():
+    corps = json.dumps({'html': "<div>a</div>", 'meta': {'total': 3, 'items': ["<p>b</p>", "texte"]}})
+    assert fragments_html_reponse(reponse(corps, "application/json")) == ["<div>a</div>", "<p>b</p>"]
+
+
+def test_paginer_catalogue_xhr_produit_les_pages_suivantes(site, scraper):
+    # Pages 0 et 1 déjà affichées par le navigateur : 40 cartes connues
+    connues = [f"{site.url}/fr/profile/{i}" for i in range(1, 41)]
+    cartes = list(scraper.paginer_catalogue_xhr(requete_voir_plus(site), connues))
+
+    assert [carte['url_profil'] for carte in cartes] == [f"{site.url}/fr/profile/{i}" for i in range(41, 46)]
+    assert cartes[0]['entreprise'] == "Entreprise 41"
+    assert cartes[0]['avatar_url'] == f"{site.url}/avatar/41.gif"
+
+
+def test_paginer_catalogue_xhr_s_arrete_a_la_fin_du_catalogue(site, scraper):
+    cartes = list(scraper.paginer_catalogue_xhr(requete_voir_plus(site, page=0)))
+
+    assert len(cartes) == 25
+    # Pages 1 et 2, puis une page vide qui termine la pagination
+    assert site.requetes == 3
@@ -0,0 +1,53 @@
+"""Extraction hors ligne : pages de profil et cartes du catalogue analysées sans navigateur"""
+
+import re
+
+import banc_essai_tony
+from scraping_tony_complet_integrated import (
+    extraire_cartes_html, parser_profil_detail_html
+)
+
+URL_PROFIL = "https://site/fr/profile/7"
+
+
+def test_parser_profil_detail_html():
+    champs = parser_profil_detail_html(banc_essai_tony.profil_html(7), URL_PROFIL)
+
+    assert champs == {
+        'elements_cles': {
+            'effectifs': '80', 'chiffre_affaires': '8 M€', 'competences': 'Transformation digitale du retail',
+        },
+        'secteur_activite': 'Secteur 7',
+        'mission': 'Mission du profil 7',
+        'nombre_points_vente': '7',
+        'solutions_competences': 'Solution 0',
+        'lien_forward': 'https://site/forward/7',
+        'lien_linkedin_direct': None,
+    }
+
+
+def test_parser_profil_detail_html_sections_reperees_par_leur_titre():
+    # Les identifiants #object-... changent : les sections sont retrouvées par leur titre
+    html = re.sub(r'id="object-[^"]+"', 'id="section-renommee"', banc_essai_tony.profil_html(7))
+
+    assert parser_profil_detail_html(html, URL_PROFIL) == parser_profil_detail_html(
+        banc_essai_tony.profil_html(7), URL_PROFIL
+    )
+
+
+def test_parser_profil_detail_html_page_vide():
+    champs = parser_profil_detail_html(banc_essai_tony.page("Vide", "<main></main>"), URL_PROFIL)
+
+    assert not champs['mission']
+    assert not champs['lien_forward']
+
+
+def test_extraire_cartes_html_liens_absolus():
+    cartes = extraire_cartes_html(banc_essai_tony.carte_html(3) + banc_essai_tony.carte_html(4), "https://site/fr/catalog")
+
+    assert cartes == [
+        {'index': None, 'entreprise': 'Entreprise 3', 'nom_prenom': 'Prénom Nom 3', 'poste': 'Poste 3',
+         'url_profil': 'https://site/fr/profile/3', 'avatar_url': 'https://site/avatar/3.gif'},
+        {'index': None, 'entreprise': 'Entreprise 4', 'nom_prenom': 'Prénom Nom 4', 'poste': 'Poste 4',
+         'url_profil': 'https://site/fr/profile/4', 'avatar_url': 'https://site/avatar/4.gif'},
+    ]
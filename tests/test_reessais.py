@@ -0,0 +1,50 @@
+"""Politique de nouvelles tentatives : seules les erreurs passagères sont retentées"""
+
+import pytest
+import requests
+from selenium.common.exceptions import (
+    InvalidArgumentException, NoSuchElementException, NoSuchWindowException, TimeoutException, WebDriverException
+)
+
+from scraping_tony_complet_integrated import BudgetProfilEpuise, PolitiqueReessai, ProfilIncomplet
+
+
+@pytest.mark.parametrize("erreur", [
+    TimeoutException("chargement"),
+    requests.Timeout("lecture"),
+    requests.ConnectionError("refus"),
+    ConnectionResetError("chromedriver"),
+    ProfilIncomplet("page vide"),
+    WebDriverException("unknown error: net::ERR_CONNECTION_RESET"),
+])
+def test_erreurs_passageres_retentees(erreur):
+    assert PolitiqueReessai.est_reessayable(erreur)
+
+
+@pytest.mark.parametrize("erreur", [
+    BudgetProfilEpuise("budget"),
+    InvalidArgumentException("invalid argument: 'url' must be a valid URL"),
+    NoSuchWindowException("fenêtre fermée"),
+    NoSuchElementException("absent"),
+    ValueError("bogue"),
+])
+def test_erreurs_deterministes_propagees(erreur):
+    assert not PolitiqueReessai.est_reessayable(erreur)
+
+
+def test_executer_ne_retente_pas_une_erreur_deterministe():
+    appels = []
+
+    def action():
+        appels.append(1)
+        raise InvalidArgumentException("invalid argument")
+
+    with pytest.raises(InvalidArgumentException):
+        PolitiqueReessai(max_tentatives=3, delai_initial=0).executer(action, "test")
+    assert len(appels) == 1
+
+
+def test_profil_sans_lien_ignore(scraper):
+    assert scraper.profil_a_ignorer(1, {'url_profil': "Non disponible"})
+    assert scraper.profil_a_ignorer(2, {'url_profil': None})
+    assert not scraper.profil_a_ignorer(3, {'url_profil': "https://site/fr/profile/3"})
@@ -0,0 +1,36 @@
+"""Sélecteurs de secours : ordre de priorité et rapport des sélecteurs morts"""
+
+import banc_essai_tony
+from scraping_tony_complet_integrated import ResolveurSelecteurs, SchemaExtraction, extraire_cartes_html
+
+
+def test_resolveur_un_selecteur_generique_gagnant_ne_passe_pas_devant():
+    resolveur = ResolveurSelecteurs()
+    incomplete = banc_essai_tony.carte_html(1).replace('<div class="catalog-company">Entreprise 1</div>', "")
+    html = incomplete + "".join(banc_essai_tony.carte_html(i) for i in range(2, 5))
+
+    cartes = extraire_cartes_html(html, "https://site/fr/catalog", resolveur)
+
+    assert [carte['entreprise'] for carte in cartes[1:]] == ["Entreprise 2", "Entreprise 3", "Entreprise 4"]
+
+
+def test_resolveur_selecteurs_morts_en_dernier():
+    resolveur = ResolveurSelecteurs()
+    resolveur.stats['champ'] = {'.mort': {'succes': 0, 'echecs': ResolveurSelecteurs.ESSAIS_MORT}}
+
+    assert resolveur.ordonner('champ', ['.mort', '.precis', '.generique']) == ['.precis', '.generique', '.mort']
+
+
+def test_selecteurs_morts_ignore_les_champs_sans_secours():
+    schema = SchemaExtraction.charger()
+    resolveur = ResolveurSelecteurs()
+    # Profils sans lien LinkedIn ni effectifs, mission introuvable par son sélecteur de secours
+    for _ in range(ResolveurSelecteurs.ESSAIS_MORT):
+        resolveur.enregistrer('lien_linkedin_direct', None, ['a.linkedin'])
+        resolveur.enregistrer('elements_cles.effectifs', None, ['.key-elements li', 'li'])
+        resolveur.enregistrer('mission', None, ['.mission-ancienne'])
+        resolveur.enregistrer('mission', '.mission', [])
+
+    assert {'lien_linkedin_direct', 'elements_cles.effectifs'} <= schema.champs_sans_secours()
+    assert 'mission' not in schema.champs_sans_secours()
+    assert resolveur.selecteurs_morts(ignorer=schema.champs_sans_secours()) == {'mission': ['.mission-ancienne']}
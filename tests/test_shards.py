@@ -0,0 +1,86 @@
+"""Coordinateur de shards : découpage, relance dans le même dossier et fusion"""
+
+import json
+import sys
+
+from scraping_tony_complet_integrated import CoordinateurShards
+
+
+def coordinateur_factice(dossier, reprise=False):
+    """Coordinateur dont chaque worker ajoute un profil 'new' à son JSONL, comme SortieJSONL"""
+    coordinateur = CoordinateurShards(1, 4, 2, str(dossier), reprise=reprise)
+
+    def commande_worker(numero, debut, nombre):
+        profil = {'url_profil': f"https://site/fr/profile/{debut}", 'position_catalogue': debut, 'run': 'new'}
+        script = (f"open({coordinateur.chemin_shard(numero)!r}, 'a', encoding='utf-8')"
+                  f".write({json.dumps(profil, ensure_ascii=False)!r} + '\\n')")
+        return [sys.executable, '-c', script], None
+
+    coordinateur.commande_worker = commande_worker
+    return coordinateur
+
+
+def ecrire_shard_precedent(coordinateur):
+    for numero, (debut, _) in enumerate(coordinateur.plages):
+        with open(coordinateur.chemin_shard(numero), 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'url_profil': f"https://site/fr/profile/{debut}",
+                                'position_catalogue': debut, 'run': 'old'}) + "\n")
+
+
+def lire(chemin):
+    with open(chemin, encoding='utf-8') as f:
+        return [json.loads(ligne) for ligne in f]
+
+
+def test_decouper_plages_equilibrees():
+    assert CoordinateurShards.decouper(1, 10, 3) == [(1, 4), (5, 3), (8, 3)]
+    assert CoordinateurShards.decouper(5, 2, 4) == [(5, 1), (6, 1)]
+
+
+def test_relance_sans_reprise_ignore_les_shards_precedents(tmp_path):
+    coordinateur = coordinateur_factice(tmp_path / "shards")
+    (tmp_path / "shards").mkdir()
+    ecrire_shard_precedent(coordinateur)
+
+    assert coordinateur.executer(str(tmp_path / "fusion.jsonl")) == 0
+
+    profils = lire(tmp_path / "fusion.jsonl")
+    assert [profil['run'] for profil in profils] == ['new', 'new']
+    assert [profil['index'] for profil in profils] == [1, 2]
+
+
+def test_relance_en_reprise_conserve_les_shards_precedents(tmp_path):
+    coordinateur = coordinateur_factice(tmp_path / "shards", reprise=True)
+    (tmp_path / "shards").mkdir()
+    ecrire_shard_precedent(coordinateur)
+
+    assert coordinateur.executer(str(tmp_path / "fusion.jsonl")) == 0
+
+    assert [profil['run'] for profil in lire(tmp_path / "fusion.jsonl")] == ['old', 'old']
+
+
+def test_fichiers_d_entree_copies_sur_les_hotes_distants(tmp_path):
+    schema = tmp_path / "schema.json"
+    schema.write_text("{}", encoding='utf-8')
+    coordinateur = CoordinateurShards(
+        1, 4, 2, str(tmp_path / "shards"), hotes=["machine:/opt/tony"],
+        fichiers_workers=[('--schema', str(schema)), ('--cookies', str(tmp_path / "absent.json"))]
+    )
+
+    assert coordinateur.commandes_copie("machine:/opt/tony") == [
+        ['scp', '-q', str(schema), "machine:/opt/tony/tony_schema_schema.json"],
+    ]
+    commande, distant = coordinateur.commande_worker(0, 1, 2)
+    assert commande[:2] == ['ssh', 'machine']
+    assert "--schema tony_schema_schema.json" in commande[2]
+    assert str(tmp_path) not in commande[2]
+    assert "--cookies" not in commande[2]
+
+
+def test_fichiers_d_entree_locaux_en_chemin_absolu(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    coordinateur = CoordinateurShards(1, 2, 1, "shards", fichiers_workers=[('--schema', "schema.json")])
+
+    commande, distant = coordinateur.commande_worker(0, 1, 2)
+    assert distant is None
+    assert commande[commande.index('--schema') + 1] == str(tmp_path / "schema.json")
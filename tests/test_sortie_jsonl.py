@@ -0,0 +1,39 @@
+"""Journal JSONL au fil de l'eau : nouvelle exécution ou reprise"""
+
+import json
+
+
+def preparer_journal(chemin):
+    chemin.write_text(json.dumps({'url_profil': "https://site/fr/profile/1", 'run': 'old'}) + "\n", encoding='utf-8')
+
+
+def profils_exportes(dossier):
+    (sortie,) = dossier.glob("profils_tony_complets_integrated_*.json")
+    return json.loads(sortie.read_text(encoding='utf-8'))
+
+
+def test_sans_reprise_le_journal_existant_est_vide(scraper, tmp_path):
+    journal = tmp_path / "profils.jsonl"
+    preparer_journal(journal)
+    scraper.fichier_jsonl = str(journal)
+
+    scraper.ouvrir_sortie_jsonl()
+    scraper.ajouter_profil_complet({'url_profil': "https://site/fr/profile/2", 'run': 'new'}, 2)
+    scraper.sauvegarder_resultats()
+
+    assert [profil['run'] for profil in profils_exportes(tmp_path)] == ['new']
+    assert scraper.nb_profils_complets == 1
+
+
+def test_en_reprise_le_journal_existant_est_prolonge(scraper, tmp_path):
+    journal = tmp_path / "profils.jsonl"
+    preparer_journal(journal)
+    scraper.fichier_jsonl = str(journal)
+    scraper.reprise = True
+
+    scraper.ouvrir_sortie_jsonl()
+    scraper.ajouter_profil_complet({'url_profil': "https://site/fr/profile/2", 'run': 'new'}, 2)
+    scraper.sauvegarder_resultats()
+
+    assert [profil['run'] for profil in profils_exportes(tmp_path)] == ['old', 'new']
+    assert scraper.nb_profils_complets == 2